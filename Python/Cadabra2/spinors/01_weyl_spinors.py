@@ -13,8 +13,15 @@ or inside Docker:
     docker run --rm -v $(pwd):/work cadabra2-ubuntu:24.04 python3 /work/01_weyl_spinors.py
 """
 
-import cadabra2
-from cadabra2 import Ex, ExNode, __cdbkernel__
+import numpy as np
+
+from spinor_numerics import (
+    CADABRA_DEMO, EPS_DN, EPS_UP, angle_bracket, check, report,
+)
+
+if CADABRA_DEMO:
+    import cadabra2
+    from cadabra2 import Ex, ExNode, __cdbkernel__
 
 print("=" * 60)
 print("Weyl spinors in cadabra2 (Srednicki Ch. 34-35)")
@@ -25,13 +32,14 @@ print("=" * 60)
 #    α, β, γ, δ  — undotted lower indices  (spinor indices)
 #    In cadabra2, we declare indices with their range/properties.
 # -------------------------------------------------------------------------
-__cdbkernel__ = cadabra2.create_scope()
+if CADABRA_DEMO:
+    __cdbkernel__ = cadabra2.create_scope()
 
-# Undotted spinor indices α,β,γ,δ
-cadabra2.Indices(Ex(r"{\alpha, \beta, \gamma, \delta}"), Ex(r"position=fixed"))
+    # Undotted spinor indices α,β,γ,δ
+    cadabra2.Indices(Ex(r"{\alpha, \beta, \gamma, \delta}"), Ex(r"position=fixed"))
 
-# Dotted spinor indices \dot{\alpha} etc. — represented as \dal, \dbe, etc.
-cadabra2.Indices(Ex(r"{\dal, \dbe, \dga, \dde}"), Ex(r"position=fixed"))
+    # Dotted spinor indices \dot{\alpha} etc. — represented as \dal, \dbe, etc.
+    cadabra2.Indices(Ex(r"{\dal, \dbe, \dga, \dde}"), Ex(r"position=fixed"))
 
 print("\n[1] Declared spinor indices:")
 print("    Undotted: alpha, beta, gamma, delta  (SL(2,C) fundamental)")
@@ -39,17 +47,20 @@ print("    Dotted:   dal, dbe, dga, dde          (SL(2,C) conjugate)")
 
 # -------------------------------------------------------------------------
 # 2. Epsilon tensors for raising/lowering spinor indices.
-#    ε_{αβ} and ε^{αβ} with ε_{12} = 1, ε^{12} = -1 (Srednicki convention)
+#    ε_{αβ} and ε^{αβ} with ε^{12} = ε_{21} = +1 (Srednicki eq. 34.19,
+#    as in spinor_numerics)
 #    ε_{αβ} ε^{βγ} = δ_α^γ
 # -------------------------------------------------------------------------
 # Declare epsilon as antisymmetric
-cadabra2.AntiSymmetric(Ex(r"\epsilon_{\alpha\beta}"))
-cadabra2.AntiSymmetric(Ex(r"\epsilon^{\alpha\beta}"))
+if CADABRA_DEMO:
+    cadabra2.AntiSymmetric(Ex(r"\epsilon_{\alpha\beta}"))
+    cadabra2.AntiSymmetric(Ex(r"\epsilon^{\alpha\beta}"))
 
 print("\n[2] Epsilon tensors (SL(2,C) invariant):")
 print("    eps_{alpha beta}: lowers undotted indices")
 print("    eps^{alpha beta}: raises undotted indices")
-print("    Convention: eps_{12} = 1, eps_{21} = -1  (Srednicki)")
+print("    Convention: eps^{12} = eps_{21} = 1, eps^{21} = eps_{12} = -1  (Srednicki)")
+
 
 # -------------------------------------------------------------------------
 # 3. Define Weyl spinors
@@ -57,14 +68,14 @@ print("    Convention: eps_{12} = 1, eps_{21} = -1  (Srednicki)")
 #    χ^α : left-handed with raised index
 #    Raising: χ^α = ε^{αβ} χ_β
 # -------------------------------------------------------------------------
-# These are just symbols/expressions in cadabra2
-psi_lower = Ex(r"\psi_{\alpha}")
-chi_lower = Ex(r"\chi_{\beta}")
-chi_upper = Ex(r"\chi^{\alpha}")
-
 print("\n[3] Weyl spinor fields:")
-print("    psi_{alpha} =", psi_lower)
-print("    chi_{beta}  =", chi_lower)
+# These are just symbols/expressions in cadabra2
+if CADABRA_DEMO:
+    psi_lower = Ex(r"\psi_{\alpha}")
+    chi_lower = Ex(r"\chi_{\beta}")
+    chi_upper = Ex(r"\chi^{\alpha}")
+    print("    psi_{alpha} =", psi_lower)
+    print("    chi_{beta}  =", chi_lower)
 print("    chi^{alpha} = eps^{alpha beta} chi_{beta}  (raised index)")
 
 # -------------------------------------------------------------------------
@@ -75,10 +86,22 @@ print("    chi^{alpha} = eps^{alpha beta} chi_{beta}  (raised index)")
 #    The angle bracket is antisymmetric: <psi chi> = -<chi psi>
 # -------------------------------------------------------------------------
 # Represent as expressions
-angle_product = Ex(r"\epsilon^{\alpha\beta} \psi_{\alpha} \chi_{\beta}")
 print("\n[4] Lorentz-invariant spinor products:")
 print("    <psi chi> = eps^{alpha beta} psi_{alpha} chi_{beta}")
-print("             =", angle_product)
+if CADABRA_DEMO:
+    angle_product_ex = Ex(r"\epsilon^{\alpha\beta} \psi_{\alpha} \chi_{\beta}")
+    print("             =", angle_product_ex)
+
+# Numerically, for commuting components: spinor_numerics.angle_bracket (the
+# unrolled form) vs. the ε contraction
+psi_num = np.array([1.0 + 2.0j, -0.5j])
+chi_num = np.array([0.3, 2.0 - 1.0j])
+check("angle_bracket = einsum(eps^{ab}, psi_a, chi_b)",
+      abs(angle_bracket(psi_num, chi_num)
+          - np.einsum('ab,a,b->', EPS_UP, psi_num, chi_num)))
+check("<psi psi> = 0", abs(angle_bracket(psi_num, psi_num)))
+check("eps_{ab} eps^{bc} = delta_a^c", np.abs(EPS_DN @ EPS_UP - np.eye(2)).max())
+report("epsilon contractions")
 
 # Show antisymmetry symbolically: <psi chi> = -<chi psi>
 # This follows from antisymmetry of epsilon and Grassmann nature of spinors.
@@ -99,16 +122,18 @@ print("    <psi chi> = -<chi psi>  [antisymmetric under swap]")
 #    psibar^{alpha-dot} = complex conjugate of psi_alpha
 #    psibar_{alpha-dot} = eps_{alpha-dot beta-dot} psibar^{beta-dot}
 # -------------------------------------------------------------------------
-psibar_upper = Ex(r"\bar{\psi}^{\dal}")
-psibar_lower = Ex(r"\bar{\psi}_{\dal}")
+if CADABRA_DEMO:
+    psibar_upper = Ex(r"\bar{\psi}^{\dal}")
+    psibar_lower = Ex(r"\bar{\psi}_{\dal}")
 
 print("\n[6] Dotted (right-handed) spinors:")
 print("    psibar^{dotalpha} — conjugate rep (0,1/2)")
 print("    psibar_{dotalpha} = eps_{dotalpha dotbeta} psibar^{dotbeta}")
 
-square_product = Ex(r"\epsilon_{\dal\dbe} \bar{\psi}^{\dal} \bar{\chi}^{\dbe}")
 print("    [psi chi] = eps_{dala dalb} psibar^{dala} chibar^{dalb}")
-print("             =", square_product)
+if CADABRA_DEMO:
+    square_product = Ex(r"\epsilon_{\dal\dbe} \bar{\psi}^{\dal} \bar{\chi}^{\dbe}")
+    print("             =", square_product)
 
 # -------------------------------------------------------------------------
 # 6. Summary of conventions (Srednicki Ch. 34)
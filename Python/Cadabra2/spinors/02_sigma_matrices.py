@@ -13,26 +13,35 @@ or inside Docker:
     docker run --rm -v $(pwd):/work cadabra2-ubuntu:24.04 python3 /work/02_sigma_matrices.py
 """
 
-import cadabra2
-from cadabra2 import Ex, __cdbkernel__
+import numpy as np
+
+from spinor_numerics import (
+    CADABRA_DEMO, GAMMA, GAMMA_LOWER, GAMMA_TABLE, METRIC, SIGMA, SIGMA_BAR,
+    SIGMA_BAR_LOWER, check, report, sigma_completeness, sigma_sigmabar)
+
+if CADABRA_DEMO:
+    import cadabra2
+    from cadabra2 import Ex, __cdbkernel__
 
 print("=" * 60)
 print("Sigma matrices in cadabra2 (Srednicki Ch. 35-36)")
 print("=" * 60)
 
-__cdbkernel__ = cadabra2.create_scope()
+if CADABRA_DEMO:
+    __cdbkernel__ = cadabra2.create_scope()
 
 # -------------------------------------------------------------------------
 # 1. Declare indices
 # -------------------------------------------------------------------------
-# Spacetime (Lorentz) index μ,ν,ρ,σ — vector rep
-cadabra2.Indices(Ex(r"{\mu, \nu, \rho, \sigma}"), Ex(r"position=free"))
+if CADABRA_DEMO:
+    # Spacetime (Lorentz) index μ,ν,ρ,σ — vector rep
+    cadabra2.Indices(Ex(r"{\mu, \nu, \rho, \sigma}"), Ex(r"position=free"))
 
-# Undotted spinor indices
-cadabra2.Indices(Ex(r"{\alpha, \beta, \gamma}"), Ex(r"position=fixed"))
+    # Undotted spinor indices
+    cadabra2.Indices(Ex(r"{\alpha, \beta, \gamma}"), Ex(r"position=fixed"))
 
-# Dotted spinor indices
-cadabra2.Indices(Ex(r"{\dal, \dbe, \dga}"), Ex(r"position=fixed"))
+    # Dotted spinor indices
+    cadabra2.Indices(Ex(r"{\dal, \dbe, \dga}"), Ex(r"position=fixed"))
 
 print("\n[1] Index declarations:")
 print("    Spacetime: mu, nu, rho, sigma  (Lorentz/vector)")
@@ -51,12 +60,12 @@ print("    Dotted:    dal, dbe, dga       (right-handed spinor)")
 #    σ̄^{μ α̇α} = ε^{α̇β̇} ε^{αβ} σ^μ_{ββ̇}
 #    σ̄^0 = I,  σ̄^i = -σ^i
 # -------------------------------------------------------------------------
-sigma = Ex(r"\sigma^\mu_{\alpha\dal}")
-sigma_bar = Ex(r"\bar{\sigma}^{\mu\dal\alpha}")
-
 print("\n[2] Sigma matrices:")
-print("    sigma^mu_{alpha dotalpha} =", sigma)
-print("    sigmabar^{mu dotalpha alpha} =", sigma_bar)
+if CADABRA_DEMO:
+    sigma = Ex(r"\sigma^\mu_{\alpha\dal}")
+    sigma_bar = Ex(r"\bar{\sigma}^{\mu\dal\alpha}")
+    print("    sigma^mu_{alpha dotalpha} =", sigma)
+    print("    sigmabar^{mu dotalpha alpha} =", sigma_bar)
 print("\n    Explicit components (Srednicki metric signature -+++  or +---):")
 print("    sigma^0 = identity_2x2")
 print("    sigma^i = Pauli matrices sigma^i  (i=1,2,3)")
@@ -76,9 +85,10 @@ print("    (Srednicki eq. 36.4, metric signature -+++)")
 # The trace formula follows from the Clifford algebra / Pauli matrix algebra:
 #   Tr[sigma^mu sigmabar^nu] = -2 eta^{mu nu}
 
-trace_id = Ex(r"\sigma^\mu_{\alpha\dal} \bar{\sigma}_\mu^{\dal\beta}")
 print("\n    Trace: sigma^mu_{alpha dal} sigmabar_{mu}^{dal beta}")
-print("         =", trace_id)
+if CADABRA_DEMO:
+    trace_id = Ex(r"\sigma^\mu_{\alpha\dal} \bar{\sigma}_\mu^{\dal\beta}")
+    print("         =", trace_id)
 print("         = -2 delta_alpha^beta  (spinor trace)")
 
 # -------------------------------------------------------------------------
@@ -88,10 +98,11 @@ print("         = -2 delta_alpha^beta  (spinor trace)")
 #             = [[E+pz,  px-ipy],
 #                [px+ipy, E-pz]]
 # -------------------------------------------------------------------------
-momentum_matrix = Ex(r"p_\mu \sigma^\mu_{\alpha\dal}")
 print("\n[4] Momentum matrix p_{alpha dotalpha}:")
 print("    p_{alpha dal} = p_mu sigma^mu_{alpha dal}")
-print("                 =", momentum_matrix)
+if CADABRA_DEMO:
+    momentum_matrix = Ex(r"p_\mu \sigma^\mu_{\alpha\dal}")
+    print("                 =", momentum_matrix)
 print("""
     Explicit 2x2 matrix form (for p^mu = (E, px, py, pz)):
 
@@ -132,4 +143,33 @@ print("    These generate SL(2,C) transformations on left-handed spinors.")
 print("    The (anti-)self-dual decomposition F^{mu nu} = F^+ + F^-")
 print("    is encoded in sigma^{mu nu} and sigmabar^{mu nu}.")
 
+# -------------------------------------------------------------------------
+# 7. Numerical check of the 4-component Clifford algebra
+#    {γ^μ, γ^ν} = -2 g^{μν},  γ_μ γ^μ = -4,  γ_5 = i γ^0 γ^1 γ^2 γ^3 = diag(-I, I)
+#    All γ^μ γ^ν products come from the memoized GAMMA_TABLE.
+# -------------------------------------------------------------------------
+GG = GAMMA_TABLE.GG
+anticommutator = GG + GG.transpose(1, 0, 2, 3)
+expected = -2 * np.einsum('mn,ij->mnij', np.linalg.inv(METRIC), np.eye(4))
+
+print("\n[7] Numerical check (Weyl basis):")
+check("{gamma^mu, gamma^nu} = -2 g^{mu nu}",
+      np.abs(anticommutator - expected).max())
+check("gamma_mu gamma^mu = -4",
+      np.abs(np.einsum('mij,mjk->ik', GAMMA_LOWER, GAMMA) + 4 * np.eye(4)).max())
+check("gamma_5 = i gamma^0 gamma^1 gamma^2 gamma^3 = diag(-1,-1,1,1)",
+      np.abs(GAMMA_TABLE.gamma5 - np.diag([-1, -1, 1, 1])).max())
+report("Clifford algebra")
+
+# 2-component versions of [3] and [5], through the precompiled contractions
+eye2 = np.eye(2)
+SSB = sigma_sigmabar(SIGMA, SIGMA_BAR)
+check("sigma^mu sigmabar^nu + (mu <-> nu) = -2 eta^{mu nu}",
+      np.abs(SSB + SSB.transpose(1, 0, 2, 3)
+             + 2 * np.einsum('mn,ac->mnac', np.linalg.inv(METRIC), eye2)).max())
+check("sigma^mu_{alpha dal} sigmabar_mu^{dbe beta} = -2 delta delta",
+      np.abs(sigma_completeness(SIGMA, SIGMA_BAR_LOWER)
+             + 2 * np.einsum('ab,cd->acdb', eye2, eye2)).max())
+report("sigma matrices")
+
 print("\nDone: 02_sigma_matrices.py")
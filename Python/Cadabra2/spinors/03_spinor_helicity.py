@@ -16,14 +16,18 @@ or inside Docker:
     docker run --rm -v $(pwd):/work cadabra2-ubuntu:24.04 python3 /work/03_spinor_helicity.py
 """
 
-import cadabra2
-from cadabra2 import Ex, __cdbkernel__
+from spinor_numerics import CADABRA_DEMO
+
+if CADABRA_DEMO:
+    import cadabra2
+    from cadabra2 import Ex, __cdbkernel__
 
 print("=" * 60)
 print("Spinor-helicity formalism (Srednicki Ch. 36-37)")
 print("=" * 60)
 
-__cdbkernel__ = cadabra2.create_scope()
+if CADABRA_DEMO:
+    __cdbkernel__ = cadabra2.create_scope()
 
 # -------------------------------------------------------------------------
 # 1. Setup: massless momentum as a 2x2 matrix
@@ -82,8 +86,9 @@ print("    s_{ij} >= 0 for physical (timelike) channel")
 print("    s_{12} = <12>[21] = (p1+p2)^2")
 
 # Symbolic expression
-s12 = Ex(r"A_{12} B_{21}")  # placeholder for <12>[21]
-print("\n    Symbolic: s_12 = <12>[21] =", s12)
+if CADABRA_DEMO:
+    s12 = Ex(r"A_{12} B_{21}")  # placeholder for <12>[21]
+    print("\n    Symbolic: s_12 = <12>[21] =", s12)
 
 # -------------------------------------------------------------------------
 # 4. Momentum conservation in spinor notation
@@ -124,7 +129,15 @@ print("    tensor in 2D). Every SL(2,C) invariant 4-spinor contraction reduces."
 #    p_{αα̇} = E * [[1+1, 0], [0, 1-1]] = E * [[2, 0], [0, 0]]
 #    => λ_α = sqrt(2E) * (1, 0)^T,  λ̃_{α̇} = sqrt(2E) * (1, 0)^T
 # -------------------------------------------------------------------------
-import cmath, math
+from collections import namedtuple
+import math
+import numpy as np
+
+from spinor_numerics import CDTYPE, check, dot4, report, slash
+
+# A bispinor p_{αα̇} = [[E+pz, px-i py], [px+i py, E-pz]] is fixed by E and
+# its two independent entries, stored as plain scalars instead of a 2x2 list.
+Momentum = namedtuple('Momentum', ['pm', 'pt'])  # pm = E + pz, pt = px + i py
 
 print("\n[6] Numerical example: p = E * (1, 0, 0, 1)  [massless along z]")
 E = 1.0
@@ -132,16 +145,29 @@ E = 1.0
 # p_{alpha dotalpha} = E*sigma^0 + E*sigma^3
 # sigma^0 = [[1,0],[0,1]], sigma^3 = [[1,0],[0,-1]]
 # sum = [[2,0],[0,0]]  * E
-p_mat = [[2*E, 0], [0, 0]]
-print(f"    p_{{alpha dotalpha}} = {p_mat}")
-print(f"    det = {p_mat[0][0]*p_mat[1][1] - p_mat[0][1]*p_mat[1][0]:.3f}  (= 0 confirms p^2 = 0)")
-
-lam = [math.sqrt(2*E), 0.0]
-lam_tilde = [math.sqrt(2*E), 0.0]
-print(f"    lambda_alpha = {lam}")
-print(f"    lambdatilde_{{dotalpha}} = {lam_tilde}")
+p = Momentum(pm=2*E, pt=0j)
+p_mat = np.array([[p.pm, p.pt.conjugate()], [p.pt, 2*E - p.pm]])
+print(f"    p_{{alpha dotalpha}} = {p_mat.real.tolist()}")
+# det p_{αα̇} = (E+pz)(E-pz) - |px + i py|^2
+det = p.pm * (2*E - p.pm) - abs(p.pt)**2
+print(f"    det = {det:.3f}  (= 0 confirms p^2 = 0)")
+p_mu = np.array([E, 0.0, 0.0, E])
+print(f"    p^mu p_mu = {dot4(p_mu, p_mu):.3f}  (Minkowski product, metric -+++)")
+p_slash = slash(p_mu)
+check("pslash pslash = -p^2 = 0",
+      np.abs(p_slash @ p_slash + dot4(p_mu, p_mu) * np.eye(4)).max())
+
+# Massless: lambda = (sqrt(pm), pt / sqrt(pm)), lambdatilde = conj(lambda)
+sq = math.sqrt(p.pm)
+lam = np.asarray([sq, p.pt / sq], dtype=CDTYPE)
+lam_tilde = lam.conj()
+print(f"    lambda_alpha = {lam.real}")
+print(f"    lambdatilde_{{dotalpha}} = {lam_tilde.real}")
 # Check: lambda ⊗ lambdatilde = p_mat
-outer = [[lam[i]*lam_tilde[j] for j in range(2)] for i in range(2)]
-print(f"    lambda_alpha x lambdatilde_dotalpha = {outer}  (check: matches p_mat ✓)")
+outer = np.outer(lam, lam_tilde)
+print(f"    lambda_alpha x lambdatilde_dotalpha = {np.round(outer.real, 6).tolist()}")
+check("lambda x lambdatilde = p_{alpha dotalpha}",
+      np.abs(outer - p_mat).max())
+report("massless momentum")
 
 print("\nDone: 03_spinor_helicity.py")
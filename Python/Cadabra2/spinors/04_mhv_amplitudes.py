@@ -20,15 +20,23 @@ or inside Docker:
     docker run --rm -v $(pwd):/work cadabra2-ubuntu:24.04 python3 /work/04_mhv_amplitudes.py
 """
 
-import cadabra2
-from cadabra2 import Ex, __cdbkernel__
-import cmath, math
+import math
+import numpy as np
+
+from spinor_numerics import (
+    CADABRA_DEMO, CDTYPE, angle_bracket, angle_bracket_matrix, check, parke_taylor_4,
+    parke_taylor_from_brackets, parke_taylor_n, report, spinors_from_angles)
+
+if CADABRA_DEMO:
+    import cadabra2
+    from cadabra2 import Ex, __cdbkernel__
 
 print("=" * 60)
 print("MHV amplitudes and Parke-Taylor formula (Srednicki Ch. 38)")
 print("=" * 60)
 
-__cdbkernel__ = cadabra2.create_scope()
+if CADABRA_DEMO:
+    __cdbkernel__ = cadabra2.create_scope()
 
 # -------------------------------------------------------------------------
 # 1. The Parke-Taylor formula
@@ -77,7 +85,8 @@ print("""
 
 # Symbolic Parke-Taylor amplitude (cadabra2 expression)
 # We represent angle brackets as A_{ij} and square brackets as B_{ij}
-PT4 = Ex(r"A_{12}^4 / (A_{12} A_{23} A_{34} A_{41})")
+if CADABRA_DEMO:
+    PT4 = Ex(r"A_{12}^4 / (A_{12} A_{23} A_{34} A_{41})")
 print("    Symbolic (A_{ij} = <ij>):")
 print("    A_4 = A_{12}^4 / (A_{12} A_{23} A_{34} A_{41})")
 print("        = A_{12}^3 / (A_{23} A_{34} A_{41})")
@@ -106,33 +115,17 @@ print()
 # p3 = -E(1, sin(th), 0, cos(th))  [outgoing -> incoming with minus sign]
 # p4 = -E(1, -sin(th), 0, -cos(th))
 
-import cmath
-
-def angle_bracket(lam_i, lam_j):
-    """<ij> = eps^{ab} lam_i_a lam_j_b = lam_i[0]*lam_j[1] - lam_i[1]*lam_j[0]"""
-    return lam_i[0]*lam_j[1] - lam_i[1]*lam_j[0]
-
-def square_bracket(lamt_i, lamt_j):
-    """[ij] = eps_{dota dotb} lamtilde_i^{dota} lamtilde_j^{dotb}"""
-    return lamt_i[0]*lamt_j[1] - lamt_i[1]*lamt_j[0]
-
-def parke_taylor_4(lam_list, neg_hel_i, neg_hel_j):
-    """
-    Compute A_4(... i^- j^- ...) / (i*g^2) = <ij>^4 / product of adjacent <ab>
-    lam_list: list of 4 angle spinors [lam1, lam2, lam3, lam4]
-    neg_hel_i, neg_hel_j: 0-indexed positions of negative helicity gluons
-    """
-    n = 4
-    # Numerator: <ij>^4
-    num = angle_bracket(lam_list[neg_hel_i], lam_list[neg_hel_j])**4
-    # Denominator: cyclic product <12><23><34><41>
-    denom = 1.0 + 0j
-    for k in range(n):
-        denom *= angle_bracket(lam_list[k], lam_list[(k+1) % n])
-    return num / denom
+# The bracket and amplitude helpers live in spinor_numerics so they can be
+# imported without cadabra2:
+#   angle_bracket(lam_i, lam_j)   <ij> = lam_i[0]*lam_j[1] - lam_i[1]*lam_j[0]
+#   square_bracket(lt_i, lt_j)    [ij], same closed form on lambdatilde
+#   angle_bracket_matrix(lams)    all <ij> as an (n,n) table
+#   parke_taylor_4(L, i, j)       <ij>^4 / (<12><23><34><41>), one point or a batch
+#   parke_taylor_from_brackets    the same from a precomputed <ij> table
+#   parke_taylor_n(n)             n-gluon version, built once per n
+#   spinors_from_angles(E, ths)   lambda = sqrt(E) (cos(th/2), sin(th/2)) per angle
 
 # Kinematics: theta = pi/3 (60 degrees) scattering
-import math
 theta = math.pi / 3
 E = 1.0
 
@@ -145,36 +138,70 @@ E = 1.0
 #   lambda = sqrt(E) * (cos(th/2), sin(th/2))
 #   lambdatilde = sqrt(E) * (cos(th/2), sin(th/2))  [for real momenta]
 
-def spinor_from_momentum_angle(E, theta_p):
-    """Angle spinor for p = E*(1, sin(th), 0, cos(th))"""
-    c = math.cos(theta_p/2)
-    s = math.sin(theta_p/2)
-    sq = math.sqrt(E)
-    return (sq * c, sq * s)
+def mhv_kinematics(E, thetas):
+    """The 4 spinors of this section per scattering angle: shape S + (4,2)
+    for thetas of shape S, so a scalar theta gives one (4,2) point."""
+    thetas = np.asarray(thetas)
+    L = np.empty(thetas.shape + (4, 2), dtype=CDTYPE)
+    L[..., :2, :] = spinors_from_angles(E, [0.0, math.pi])
+    L[..., 2, :] = spinors_from_angles(E, thetas)
+    L[..., 3, :] = 1j * L[..., 2, ::-1]
+    return L
 
 # Assign momenta (using all-incoming convention, p3 and p4 flipped)
 # p1 along z: theta=0
 # p2 along -z: theta=pi
 # p3 at angle theta from z
 # p4 must satisfy p1+p2+p3+p4 = 0 => at angle pi+theta (opposite to p3)
-lam1 = spinor_from_momentum_angle(E, 0)           # p1 = E(1,0,0,1)
-lam2 = spinor_from_momentum_angle(E, math.pi)     # p2 = E(1,0,0,-1)
-lam3 = spinor_from_momentum_angle(E, theta)       # p3 at angle theta
+# Spinors are stored SoA-style as one (n, 2) complex array: row k is
+# lambda_{k+1}, column a is the spinor component.
+# p1 = E(1,0,0,1), p2 = E(1,0,0,-1), p3 at angle theta.
 # For momentum conservation, need to flip sign conventions;
 # use e^{i pi/2} = i rotation for outgoing spinors:
-lam4 = (1j * lam3[1], 1j * lam3[0])  # approximate; illustrative
-
-lam_list = [lam1, lam2, lam3, lam4]
+# lambda_4 = i * (lambda_3 reversed)  -- approximate; illustrative
+LAM = mhv_kinematics(E, theta)
 
 print(f"    Scattering angle theta = {math.degrees(theta):.1f} deg")
 print(f"    Spinors:")
-for k, l in enumerate(lam_list, 1):
+for k, l in enumerate(LAM, 1):
+    # LAM is complex throughout; real spinors print as reals, as before.
+    if not l.imag.any():
+        l = l.real
     print(f"      lambda_{k} = ({l[0]:.4f}, {l[1]:.4f})")
 
 # Compute A_4(1^-, 2^-, 3^+, 4^+): negative helicity on 1,2
-A4 = parke_taylor_4(lam_list, 0, 1)
+A4 = parke_taylor_4(LAM, 0, 1)
 print(f"\n    A_4(1^-, 2^-, 3^+, 4^+) / (i*g^2) = {A4:.6f}")
 
+# Angular scan: angles -> spinors -> amplitudes, all vectorized
+scan_deg = np.array([15.0, 30.0, 45.0, 60.0, 75.0])
+A4_scan = parke_taylor_4(mhv_kinematics(E, np.radians(scan_deg)), 0, 1)
+print("    Scan over theta:")
+for deg, amp in zip(scan_deg, A4_scan):
+    print(f"      theta = {deg:4.1f} deg:  A_4 / (i*g^2) = {amp:.6f}")
+
+# All N^2 brackets <ij> in one vectorized expression
+G = angle_bracket_matrix(LAM)
+check("<ij> = -<ji>", np.abs(G + G.T).max())
+check("Gram matrix matches <12>", abs(G[0, 1] - angle_bracket(LAM[0], LAM[1])))
+
+# Schouten identity: <12><34> + <13><42> + <14><23> = 0
+schouten = G[0, 1]*G[2, 3] + G[0, 2]*G[3, 1] + G[0, 3]*G[1, 2]
+check("Schouten <12><34> + <13><42> + <14><23> = 0", abs(schouten))
+
+# Same identity over many random spinor sets in one pass: <ij> = det[lam_i;
+# lam_j], so stack every needed pair as a (2,2) block and call det once.
+N_SCHOUTEN = 10_000
+rng = np.random.default_rng(38)
+L = (rng.standard_normal((N_SCHOUTEN, 4, 2))
+     + 1j * rng.standard_normal((N_SCHOUTEN, 4, 2))).astype(CDTYPE)
+pair_indices = np.array([[0, 1], [2, 3], [0, 2], [3, 1], [0, 3], [1, 2]])
+b12, b34, b13, b42, b14, b23 = np.linalg.det(L[:, pair_indices]).T
+schouten = b12*b34 + b13*b42 + b14*b23
+scale = abs(b12*b34) + abs(b13*b42) + abs(b14*b23)
+check(f"Schouten, {N_SCHOUTEN} random sets (relative)", np.max(abs(schouten) / scale))
+report("spinor brackets")
+
 # -------------------------------------------------------------------------
 # 4. Cyclic invariance check
 #    The Parke-Taylor formula is cyclically invariant: rotating labels
@@ -187,11 +214,32 @@ print("    when the negative helicity positions cycle accordingly.")
 
 # Cyclic rotation: 1->2, 2->3, 3->4, 4->1
 # New negative helicities at positions 2,3 (0-indexed: 1,2)
-lam_cycled = [lam2, lam3, lam4, lam1]  # cyclically shifted
-A4_cycled = parke_taylor_4(lam_cycled, 0, 1)  # new neg hel at 1,2 = old 2,3
+# The bracket table G from [3] already holds every <ij> for this kinematic
+# point, so the relabeled amplitude is assembled by index.
+A4_cycled = parke_taylor_from_brackets(G, [1, 2, 3, 0], 1, 2)
 print(f"    A_4(2^-, 3^-, 4^+, 1^+) / (i*g^2) = {A4_cycled:.6f}")
 print(f"    Ratio |A4/A4_cycled| = {abs(A4/A4_cycled):.4f}  (should be 1 for cyclic invariance)")
 
+# Both labelings as one (2,4,2) batch: same numbers, one vectorized call
+lam_cycled = np.roll(LAM, -1, axis=0)  # rows shifted: (lam2, lam3, lam4, lam1)
+A4_batch = parke_taylor_4(np.stack([LAM, lam_cycled]), 0, 1)
+check("batched A_4 matches per-point",
+      np.abs(A4_batch - [A4, A4_cycled]).max() / abs(A4))
+
+# n-point version: relabeling the spinors cyclically together with the
+# negative-helicity positions leaves A_n unchanged, checked on a batch of
+# random n = 6 configurations.
+pt6 = parke_taylor_n(6)
+L6 = (rng.standard_normal((1000, 6, 2))
+      + 1j * rng.standard_normal((1000, 6, 2))).astype(CDTYPE)
+A6 = pt6(L6, 0, 1)
+A6_cycled = pt6(np.roll(L6, -1, axis=1), 5, 0)
+check("A_6 invariant under cyclic relabeling (relative)",
+      np.max(abs(A6 - A6_cycled) / abs(A6)))
+check("parke_taylor_n(4) matches parke_taylor_4",
+      np.abs(parke_taylor_n(4)(LAM, 0, 1) - A4) / abs(A4))
+report("cyclic check")
+
 # -------------------------------------------------------------------------
 # 5. Vanishing amplitudes at tree level
 #    All-plus: A_n(1^+, 2^+, ..., n^+) = 0
@@ -0,0 +1,345 @@
+"""
+spinor_numerics.py
+==================
+Numerical (NumPy) companions to the symbolic cadabra2 examples.
+
+Conventions follow Srednicki QFT (metric signature -+++):
+    g_{μν}  = diag(-1, 1, 1, 1)
+    σ^μ     = (I, σ^i),   σ̄^μ = (I, -σ^i)
+    γ^μ     = [[0, σ^μ], [σ̄^μ, 0]]          (Weyl/chiral basis, eq. 36.39)
+    {γ^μ, γ^ν} = -2 g^{μν}
+    γ_5     = i γ^0 γ^1 γ^2 γ^3 = diag(-I, I)  (eq. 36.47)
+    ε^{12}  = ε_{21} = +1,  ε^{21} = ε_{12} = -1   (eq. 34.19)
+    <ij>    = ε^{ab} λ_i,a λ_j,b = λ_i,1 λ_j,2 - λ_i,2 λ_j,1
+
+Arithmetic is verification-only, so complex arrays default to complex64.
+Set SPINOR_HIGH_PRECISION=1 to switch back to complex128 (and the tighter
+tolerance in ATOL) for full-precision checks.
+
+Numerical checks are recorded with check() and summarized by report(); the
+summary table is only printed when SPINOR_VERBOSE=1, so headless or timed
+runs are not dominated by formatting and stdout.
+
+CADABRA_DEMO=0 runs the example scripts numerics-only: they then skip
+importing cadabra2 and building the symbolic Ex expressions.
+
+Import from the example scripts in this directory, e.g.
+    from spinor_numerics import GAMMA_TABLE, METRIC, check, dot4, report, slash
+    from spinor_numerics import EPS_DN, EPS_UP
+    from spinor_numerics import angle_bracket, parke_taylor_4
+"""
+
+from functools import cached_property
+import os
+
+import numpy as np
+
+try:
+    from opt_einsum import contract_expression
+except ImportError:
+    contract_expression = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit when numba is not installed: the decorated
+        function runs as plain Python. Supports both @njit and @njit(...)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+VERIFY_HIGH_PRECISION = os.environ.get("SPINOR_HIGH_PRECISION", "0") == "1"
+CDTYPE = np.complex128 if VERIFY_HIGH_PRECISION else np.complex64
+ATOL = 1e-12 if VERIFY_HIGH_PRECISION else 1e-6
+VERBOSE = os.environ.get("SPINOR_VERBOSE", "0") == "1"
+CADABRA_DEMO = os.environ.get("CADABRA_DEMO", "1") == "1"
+
+# name -> (residual, tolerance, passed), filled by check(), drained by report()
+_results = {}
+
+
+def check(name, residual, tol=ATOL):
+    """Record one verification result and assert that it passed.
+
+    residual is a non-negative scalar (e.g. max |lhs - rhs|); nothing is
+    printed here, see report().
+    """
+    residual = float(residual)
+    passed = residual <= tol
+    _results[name] = (residual, tol, passed)
+    assert passed, f"{name}: residual {residual:.1e} > tol {tol:.1e}"
+    return passed
+
+
+def report(title="checks"):
+    """Print the recorded results as one table (if VERBOSE) and clear them."""
+    if VERBOSE and _results:
+        width = max(len(name) for name in _results)
+        lines = [f"    [{title}]"]
+        for name, (residual, tol, passed) in _results.items():
+            mark = "✓" if passed else "✗"
+            lines.append(f"    {name:<{width}}  {residual:.1e} <= {tol:.1e}  {mark}")
+        print("\n".join(lines))
+    _results.clear()
+
+# -------------------------------------------------------------------------
+# Metric and 2-component sigma matrices, stacked along the Lorentz index μ.
+# -------------------------------------------------------------------------
+METRIC = np.diag([-1.0, 1.0, 1.0, 1.0])
+
+# ε^{αβ} and ε_{αβ} in the convention above, so ε_{αβ} ε^{βγ} = δ_α^γ. Only
+# the sign matters, so int8 is enough; einsum promotes it against complex
+# spinors.
+EPS_UP = np.array([[0, 1], [-1, 0]], dtype=np.int8)
+EPS_DN = -EPS_UP
+
+_I2 = np.eye(2, dtype=CDTYPE)
+_PAULI = np.array([
+    [[0, 1], [1, 0]],
+    [[0, -1j], [1j, 0]],
+    [[1, 0], [0, -1]],
+], dtype=CDTYPE)
+
+# σ^μ_{αα̇} and σ̄^{μ α̇α}, shape (4, 2, 2)
+SIGMA = np.concatenate([_I2[None], _PAULI])
+SIGMA_BAR = np.concatenate([_I2[None], -_PAULI])
+
+
+# σ̄_μ = g_{μν} σ̄^ν
+SIGMA_BAR_LOWER = np.ascontiguousarray(
+    SIGMA_BAR * np.diag(METRIC).astype(CDTYPE)[:, None, None])
+
+
+def compile_contraction(subscripts, *shapes):
+    """Contraction with its path optimized once, up front.
+
+    Returns a callable taking operands of the given shapes. Uses
+    opt_einsum.contract_expression when opt_einsum is installed, otherwise
+    np.einsum with a path precomputed by np.einsum_path, so repeated calls
+    skip the path search either way.
+    """
+    if contract_expression is not None:
+        return contract_expression(subscripts, *shapes, optimize="optimal")
+    dummies = [np.empty(shape, dtype=CDTYPE) for shape in shapes]
+    path, _ = np.einsum_path(subscripts, *dummies, optimize="optimal")
+    return lambda *operands: np.einsum(subscripts, *operands, optimize=path)
+
+
+# (σ^μ σ̄^ν)_α^β for all μ, ν: shape (4, 4, 2, 2)
+sigma_sigmabar = compile_contraction('mab,nbc->mnac', SIGMA.shape, SIGMA_BAR.shape)
+# σ^μ_{αα̇} σ̄_μ^{β̇β}, indexed [α, α̇, β̇, β]: shape (2, 2, 2, 2)
+sigma_completeness = compile_contraction('mab,mcd->abcd',
+                                         SIGMA.shape, SIGMA_BAR_LOWER.shape)
+
+
+def dot4(a, b):
+    """Minkowski product a·b = a^μ g_{μν} b^ν.
+
+    Works for single 4-vectors (shape (4,)) and batches (shape (N,4))
+    alike; the contraction is fused, with no intermediate g·b vector.
+    """
+    return np.einsum('...i,ij,...j->...', a, METRIC, b)
+
+
+# -------------------------------------------------------------------------
+# Dirac matrices γ^μ in the Weyl basis, shape (4, 4, 4)
+# -------------------------------------------------------------------------
+GAMMA = np.zeros((4, 4, 4), dtype=CDTYPE)
+GAMMA[:, :2, 2:] = SIGMA
+GAMMA[:, 2:, :2] = SIGMA_BAR
+
+# γ_μ = g_{μν} γ^ν, metric already folded in (g is diagonal)
+GAMMA_LOWER = np.ascontiguousarray(
+    GAMMA * np.diag(METRIC).astype(CDTYPE)[:, None, None])
+
+
+def slash(k):
+    """Feynman slash k̸ = γ^μ k_μ = γ_μ k^μ for contravariant k^μ.
+
+    One einsum over the stacked GAMMA_LOWER instead of summing four scaled
+    4x4 matrices; k may be a single 4-vector or an (N,4) batch.
+    """
+    return np.einsum('...m,mij->...ij', k, GAMMA_LOWER)
+
+
+class GammaTable:
+    """Memoized products of γ-matrices.
+
+    Each product is computed on first access and then reused, so scripts
+    that only need γ_5 never build the full (4,4,4,4) table.
+    """
+
+    def __init__(self, gamma: np.ndarray = GAMMA):
+        self._gamma = gamma
+
+    @property
+    def gamma(self) -> np.ndarray:
+        return self._gamma
+
+    @cached_property
+    def GG(self) -> np.ndarray:
+        """GG[mu, nu] = γ^μ γ^ν, shape (4, 4, 4, 4)."""
+        return np.einsum('mij,njk->mnik', self._gamma, self._gamma)
+
+    @cached_property
+    def gamma5(self) -> np.ndarray:
+        """γ_5 = i γ^0 γ^1 γ^2 γ^3, three 4x4 matmuls; GG is not built."""
+        g = self._gamma
+        return 1j * (g[0] @ g[1] @ g[2] @ g[3])
+
+
+GAMMA_TABLE = GammaTable()
+
+
+# -------------------------------------------------------------------------
+# Spinor brackets and the Parke-Taylor amplitude (04_mhv_amplitudes.py)
+# The brackets expand ε^{ab} x_a y_b in closed form (see the module
+# docstring), so no ε matrix is needed for either the single-point or the
+# batched versions.
+# -------------------------------------------------------------------------
+def angle_bracket(lam_i, lam_j):
+    """<ij> = ε^{ab} λ_i,a λ_j,b = lam_i[0]*lam_j[1] - lam_i[1]*lam_j[0].
+
+    lam_i, lam_j may be single spinors (2,) or batches (B,2).
+    """
+    return lam_i[..., 0]*lam_j[..., 1] - lam_i[..., 1]*lam_j[..., 0]
+
+
+def square_bracket(lamt_i, lamt_j):
+    """[ij] on lower-index components, ε^{ȧḃ} λ̃_i,ȧ λ̃_j,ḃ: the same closed
+    form as angle_bracket."""
+    return lamt_i[0]*lamt_j[1] - lamt_i[1]*lamt_j[0]
+
+
+def angle_bracket_matrix(lams):
+    """All pairs <ij> at once: (N,2) spinors -> (N,N) table G[i,j] = <ij>.
+
+    Built from two outer products of the spinor components.
+    """
+    lams = np.asarray(lams)
+    return np.multiply.outer(lams[:, 0], lams[:, 1]) - \
+        np.multiply.outer(lams[:, 1], lams[:, 0])
+
+
+def square_bracket_matrix(lamts):
+    """All pairs [ij] at once: (N,2) spinors -> (N,N) table."""
+    lamts = np.asarray(lamts)
+    return np.multiply.outer(lamts[:, 0], lamts[:, 1]) - \
+        np.multiply.outer(lamts[:, 1], lamts[:, 0])
+
+
+# n -> index of the cyclic successor of each leg, k -> (k+1) % n, so no
+# modulo or roll is evaluated per call
+_CYCLIC_NEXT = {n: np.roll(np.arange(n), -1) for n in range(3, 13)}
+
+
+def _cyclic_next(n):
+    return _CYCLIC_NEXT[n] if n in _CYCLIC_NEXT else np.roll(np.arange(n), -1)
+
+
+def _pow4(z):
+    """z**4 as two squarings: for complex z, ** goes through a general
+    complex power (exp/log) instead of three multiplies."""
+    z2 = z*z
+    return z2*z2
+
+
+def _bracket_src(i, j):
+    return f"(L[{i}, 0]*L[{j}, 1] - L[{i}, 1]*L[{j}, 0])"
+
+
+# (n, i, j) -> generated single-point kernel, filled by _make_parke_taylor
+_PARKE_TAYLOR_KERNELS = {}
+
+
+def _make_parke_taylor(n, i, j):
+    """Straight-line single-point kernel L -> <ij>^4 / (<12><23>...<n1>).
+
+    The source is generated for fixed (n, i, j), so every bracket index is a
+    literal and there is no loop or modulo left; it is exec'd once, compiled
+    with njit when numba is installed, and cached on (n, i, j).
+    """
+    key = (n, i, j)
+    if key not in _PARKE_TAYLOR_KERNELS:
+        denom = " * ".join(_bracket_src(k, nxt) for k, nxt in enumerate(_cyclic_next(n)))
+        src = (f"def _pt(L):\n"
+               f"    z = {_bracket_src(i, j)}\n"
+               f"    z2 = z*z\n"
+               f"    return z2*z2 / ({denom})\n")
+        namespace = {}
+        exec(src, namespace)
+        _PARKE_TAYLOR_KERNELS[key] = njit(namespace["_pt"])
+    return _PARKE_TAYLOR_KERNELS[key]
+
+
+def parke_taylor_4(lam_list, neg_hel_i, neg_hel_j, dtype=CDTYPE):
+    """A_4(... i^- j^- ...) / (i g^2) = <ij>^4 / (<12><23><34><41>).
+
+    lam_list is one kinematic point, as a (4,2) array or a list
+    [lam1, ..., lam4], or a batch of points as a (B,4,2) array; neg_hel_i,
+    neg_hel_j are the 0-indexed positions of the negative-helicity gluons.
+    Returns a scalar for one point, a (B,) array for a batch.
+
+    The spinors are evaluated in dtype (complex64 by default, see CDTYPE),
+    which halves memory traffic for large scans. Pass dtype=np.complex128
+    near collinear limits, where some <ab> -> 0 and the denominator loses
+    precision.
+    """
+    L = np.asarray(lam_list, dtype=dtype)
+    if L.ndim == 2:
+        return _make_parke_taylor(4, neg_hel_i, neg_hel_j)(L)
+    # Numerator: <ij>^4
+    num = _pow4(angle_bracket(L[..., neg_hel_i, :], L[..., neg_hel_j, :]))
+    # Denominator: cyclic product <12><23><34><41>, all four links at once.
+    # Gathering the next spinor by index avoids a rolled copy of L.
+    a, b = L[..., 0], L[..., 1]
+    nxt = _CYCLIC_NEXT[4]
+    chain = a * b[..., nxt] - b * a[..., nxt]
+    return num / chain.prod(axis=-1)
+
+
+# n -> amplitude function for n gluons, filled by parke_taylor_n
+_PARKE_TAYLOR_N = {}
+
+
+def parke_taylor_n(n):
+    """The n-gluon Parke-Taylor amplitude as a function, built once per n.
+
+    Returns f(L, neg_hel_i, neg_hel_j, dtype=CDTYPE) giving
+    <ij>^4 / (<12><23>...<n1>) for L of shape (n,2) or (B,n,2). The cyclic
+    successor indices are fixed when f is built and f is cached on n, so
+    repeated calls in a phase-space scan do no setup work.
+    """
+    if n not in _PARKE_TAYLOR_N:
+        nxt = _cyclic_next(n)
+
+        def amplitude(L, neg_hel_i, neg_hel_j, dtype=CDTYPE):
+            L = np.asarray(L, dtype=dtype)
+            a, b = L[..., 0], L[..., 1]
+            num = _pow4(angle_bracket(L[..., neg_hel_i, :], L[..., neg_hel_j, :]))
+            return num / (a * b[..., nxt] - b * a[..., nxt]).prod(axis=-1)
+
+        _PARKE_TAYLOR_N[n] = amplitude
+    return _PARKE_TAYLOR_N[n]
+
+
+def parke_taylor_from_brackets(G, order, neg_hel_i, neg_hel_j):
+    """The same amplitude from a precomputed table G[i,j] = <ij>.
+
+    Every relabeling of one kinematic point is then pure lookups. order is
+    the color ordering as a sequence of 0-indexed particle labels; neg_hel_i,
+    neg_hel_j are the labels of the negative-helicity gluons.
+    """
+    order = np.asarray(order)
+    return _pow4(G[neg_hel_i, neg_hel_j]) / G[order, order[_cyclic_next(len(order))]].prod()
+
+
+def spinors_from_angles(E, thetas):
+    """Angle spinors for p = E (1, sin θ, 0, cos θ), one per angle.
+
+    thetas of any shape S gives a CDTYPE array of shape S + (2,); cos/sin
+    are evaluated once over the whole array.
+    """
+    half = np.asarray(thetas) / 2
+    return (np.sqrt(E) * np.stack([np.cos(half), np.sin(half)], axis=-1)).astype(CDTYPE)
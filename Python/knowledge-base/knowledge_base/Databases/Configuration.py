@@ -1,30 +1,60 @@
+import asyncio
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 from .PostgreSQLConnection import PostgreSQLConnection
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+
+@lru_cache(maxsize=16)
+def _load_yaml(yaml_path: str, mtime_ns: int) -> dict:
+    """Parse a YAML file once per (path, modification time); mtime_ns is only
+    part of the cache key, so editing the file invalidates the entry."""
+    with open(yaml_path, "r") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+@dataclass(frozen=True, slots=True)
 class KnowledgeBaseSetupData:
     database_port: int
     ip_address: str
     postgres_user: str
     postgres_password: str
     database_names: Dict[str, str]
+    pool_min_size: int = PostgreSQLConnection.DEFAULT_POOL_MIN_SIZE
+    pool_max_size: int = PostgreSQLConnection.DEFAULT_POOL_MAX_SIZE
+    pool_max_inactive_connection_lifetime: float = \
+        PostgreSQLConnection.DEFAULT_POOL_MAX_INACTIVE_CONNECTION_LIFETIME
 
     @classmethod
     def from_yaml(cls, yaml_path: Path | str):
         yaml_path = Path(yaml_path)
-        with open(yaml_path, "r") as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml(str(yaml_path), yaml_path.stat().st_mtime_ns)
 
+        # The parsed config is shared through the cache, so copy the one
+        # mutable field instead of handing the cached dict to the instance.
         return cls(
             database_port=config["database_port"],
             ip_address=config["ip_address"],
             postgres_user=config["postgres_user"],
             postgres_password=config["postgres_password"],
-            database_names=config["database_names"]
+            database_names=dict(config["database_names"]),
+            pool_min_size=config.get(
+                "pool_min_size",
+                PostgreSQLConnection.DEFAULT_POOL_MIN_SIZE),
+            pool_max_size=config.get(
+                "pool_max_size",
+                PostgreSQLConnection.DEFAULT_POOL_MAX_SIZE),
+            pool_max_inactive_connection_lifetime=config.get(
+                "pool_max_inactive_connection_lifetime",
+                PostgreSQLConnection.
+                    DEFAULT_POOL_MAX_INACTIVE_CONNECTION_LIFETIME)
         )
 
     @classmethod
@@ -85,31 +115,57 @@ class KnowledgeBaseSetup:
                 database_name)
             return connection
 
+    def _get_connection(self, database_type: str) -> PostgreSQLConnection:
+        """Return the connection for a database type, creating it on first
+        use so that unused database types never get a PostgreSQLConnection."""
+        connection = self._connections.get(database_type)
+        if connection is None:
+            connection = PostgreSQLConnection(
+                self._get_dsn(),
+                self._setup_data.get_database_name(database_type))
+            self._connections[database_type] = connection
+        return connection
+
     def create_connections_for_all_databases(self):
         for database_type in self._setup_data.database_names:
-            self.create_postgresql_connection(database_type)
+            self._get_connection(database_type)
 
     async def create_pool_for_database(self, database_type: str):
-        """Create pool for given database type, creating the database if needed."""
-        if database_type not in self._connections:
-            raise ValueError(
-                f"Database type '{database_type}' not found in connections")
-
-        try:
-            database_name = self._setup_data.database_names[database_type]
-        except KeyError as err:
-            raise KeyError(
-                f"Database type '{database_type}' not found in configuration;" + \
-                    str(err))
-
-        connection = self._connections[database_type]
+        """Create pool for given database type, creating the database if
+        needed. The connection is created lazily if it does not exist yet."""
+        await self._create_database_if_missing(database_type)
+        await self._create_pool(database_type)
+        await self._get_connection(database_type).create_extension("vector")
 
+    async def create_pool_for_all_databases(self):
+        """Each database type has its own PostgreSQLConnection, so their
+        pools are created concurrently. Database types may share a database
+        name, and CREATE DATABASE / CREATE EXTENSION for one name must not
+        race, so those run one database name at a time."""
+        types_by_name = {}
+        for database_type, database_name in \
+                self._setup_data.database_names.items():
+            types_by_name.setdefault(database_name, database_type)
+
+        for database_type in types_by_name.values():
+            await self._create_database_if_missing(database_type)
+        await asyncio.gather(*(
+            self._create_pool(database_type)
+            for database_type in self._setup_data.database_names))
+        for database_type in types_by_name.values():
+            await self._get_connection(database_type).create_extension(
+                "vector")
+
+    async def _create_database_if_missing(self, database_type: str):
+        database_name = self._setup_data.get_database_name(database_type)
+        connection = self._get_connection(database_type)
         if not await connection.database_exists(database_name):
             await connection.create_database(database_name)
 
-        await connection.create_new_pool(database_name)
-        await connection.create_extension("vector")
-
-    async def create_pool_for_all_databases(self):
-        for database_type in self._setup_data.database_names:
-            await self.create_pool_for_database(database_type)
+    async def _create_pool(self, database_type: str):
+        await self._get_connection(database_type).create_new_pool(
+            self._setup_data.get_database_name(database_type),
+            min_size=self._setup_data.pool_min_size,
+            max_size=self._setup_data.pool_max_size,
+            max_inactive_connection_lifetime=
+                self._setup_data.pool_max_inactive_connection_lifetime)
@@ -2,11 +2,27 @@ from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator, Optional, List, Dict
 import asyncpg
 import json
+import numpy as np
 
 class PostgreSQLConnection:
     # For PostgreSQL, the system database is called "postgres"
     DEFAULT_SYSTEM_DB = "postgres"
 
+    # asyncpg prepares every query it runs and keeps the prepared statements
+    # in a per-connection LRU keyed by the SQL text, so repeated calls skip
+    # parse/plan. Its default of 100 entries is raised so the hot
+    # knowledge-base statements are never evicted.
+    STATEMENT_CACHE_SIZE = 1024
+
+    # Pool defaults for ingestion: enough connections for concurrent chunk
+    # writes, and idle connections are kept rather than closed after
+    # asyncpg's default 300 s, so a burst after a quiet spell does not pay
+    # for reconnecting.
+    DEFAULT_POOL_MIN_SIZE = 10
+    DEFAULT_POOL_MAX_SIZE = 50
+    DEFAULT_POOL_MAX_INACTIVE_CONNECTION_LIFETIME = 0.0
+    DEFAULT_POOL_MAX_QUERIES = 50_000
+
     def __init__(self, server_data_source_name: str, database_name: str = None):
         """
         Args:
@@ -24,6 +40,20 @@ class PostgreSQLConnection:
     def convert_list_to_string(input_list) -> str:
         return json.dumps(input_list)
 
+    @staticmethod
+    def convert_array_to_strings(array) -> List[str]:
+        """
+        Format each row of a 2-D float array as a pgvector literal.
+
+        Values are written as float32 with "%.9g", which round-trips float32
+        exactly and is much shorter than the float64 repr json.dumps emits.
+        Each row is formatted with one % operation instead of an encoder
+        pass over a Python list.
+        """
+        rows = np.asarray(array, dtype=np.float32)
+        row_format = "[" + ",".join(["%.9g"] * rows.shape[1]) + "]"
+        return [row_format % tuple(row) for row in rows.tolist()]
+
     @property
     def system_dsn(self) -> str:
         """Get the DSN for connecting to the system database."""
@@ -59,9 +89,14 @@ class PostgreSQLConnection:
     async def create_new_pool(
             self,
             database_name: Optional[str] = None,
-            min_size: int = 10,
-            max_size: int = 20) -> asyncpg.Pool:
-        """Create a new connection pool for the specified database."""
+            min_size: int = DEFAULT_POOL_MIN_SIZE,
+            max_size: int = DEFAULT_POOL_MAX_SIZE,
+            max_inactive_connection_lifetime: float =
+                DEFAULT_POOL_MAX_INACTIVE_CONNECTION_LIFETIME,
+            max_queries: int = DEFAULT_POOL_MAX_QUERIES) -> asyncpg.Pool:
+        """Create a new connection pool for the specified database.
+        max_inactive_connection_lifetime of 0 keeps idle connections open;
+        a connection is replaced after max_queries queries."""
         if database_name is None and self._database_name is None:
             raise ValueError(
                 "No database name provided and no default database name set")
@@ -75,10 +110,28 @@ class PostgreSQLConnection:
         self._pool = await asyncpg.create_pool(
             f"{self._server_data_source_name}/{database_name}",
             min_size=min_size,
-            max_size=max_size
+            max_size=max_size,
+            max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+            max_queries=max_queries,
+            statement_cache_size=self.STATEMENT_CACHE_SIZE
         )
         return self._pool
 
+    def pool_status(self) -> Optional[Dict[str, int]]:
+        """Connection counts for the pool, to check whether it saturates
+        during ingestion, or None if no pool has been created."""
+        if self._pool is None:
+            return None
+        size = self._pool.get_size()
+        idle = self._pool.get_idle_size()
+        return {
+            'min_size': self._pool.get_min_size(),
+            'max_size': self._pool.get_max_size(),
+            'size': size,
+            'idle': idle,
+            'in_use': size - idle
+        }
+
     async def close_pool(self):
         """Close the connection pool if it exists."""
         if self._pool is not None:
@@ -112,7 +165,8 @@ class PostgreSQLConnection:
                 self._connection = None
 
             self._connection = await asyncpg.connect(
-                f"{self._server_data_source_name}/{database_name}")
+                f"{self._server_data_source_name}/{database_name}",
+                statement_cache_size=self.STATEMENT_CACHE_SIZE)
             try:
                 yield self._connection
             finally:
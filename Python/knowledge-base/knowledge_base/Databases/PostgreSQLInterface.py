@@ -2,8 +2,31 @@ from .CommonSQLStatements import CommonSQLStatements
 from .PostgreSQLConnection import PostgreSQLConnection
 from .SQLStatements import KnowledgeBaseSQLStatements
 
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+import asyncpg
+import io
 import json
+import time
+
+
+# Escapes for COPY ... (FORMAT text); None is written as the NULL marker \N.
+_COPY_TEXT_ESCAPES = str.maketrans({
+    "\\": "\\\\",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\r": "\\r",
+})
+
+
+def _rows_to_copy_text(rows) -> bytes:
+    """Serialize rows as the body of a COPY ... FROM STDIN in text format."""
+    return "".join(
+        "\t".join(
+            "\\N" if value is None else str(value).translate(
+                _COPY_TEXT_ESCAPES)
+            for value in row) + "\n"
+        for row in rows).encode("utf-8")
 
 
 class KnowledgeBaseInterface:
@@ -11,15 +34,95 @@ class KnowledgeBaseInterface:
 
     DOCUMENTS_TABLE_NAME = "knowledge_base_documents"
     CHUNKS_TABLE_NAME = "knowledge_base_chunks"
+    CHUNK_COLUMNS = (
+        "document_id",
+        "chunk_index",
+        "total_chunks",
+        "content",
+        "content_hash",
+        "embedding",
+    )
+
+    # hnsw.ef_search bounds how many candidates an HNSW scan returns, so it
+    # caps both recall and the number of rows a LIMIT can be filled from.
+    # The base value grows with the table ((max chunk count, ef_search),
+    # checked in order); a search always asks for at least
+    # EF_SEARCH_PER_RESULT candidates per requested row, up to pgvector's
+    # maximum of EF_SEARCH_MAX.
+    EF_SEARCH_BY_CHUNK_COUNT = ((100_000, 40), (1_000_000, 100))
+    EF_SEARCH_LARGE = 200
+    EF_SEARCH_PER_RESULT = 4
+    EF_SEARCH_MAX = 1000
+    # The chunk count behind the base value is re-estimated this often;
+    # chunks this interface inserts in between are added to the estimate,
+    # since pg_class only catches up after (auto)ANALYZE.
+    EF_SEARCH_REFRESH_SECONDS = 600.0
+
+    # HNSW build parameters (m, ef_construction) by expected table size,
+    # ((max chunk count, (m, ef_construction)), ...) checked in order; see
+    # hnsw_build_parameters.
+    HNSW_BUILD_PARAMETERS_BY_CHUNK_COUNT = (
+        (100_000, (16, 64)),
+        (1_000_000, (24, 100)),
+    )
+    HNSW_BUILD_PARAMETERS_LARGE = (32, 128)
+    # Hash partitions of the chunks table, each with its own HNSW index.
+    CHUNK_PARTITION_COUNT = 8
+    # Lets the HNSW graph be built in memory instead of spilling to disk.
+    HNSW_MAINTENANCE_WORK_MEM = "2GB"
 
-    def __init__(self, postgres_connection: PostgreSQLConnection):
+    def __init__(
+            self,
+            postgres_connection: PostgreSQLConnection,
+            hnsw_m: int = 16,
+            hnsw_ef_construction: int = 64):
         """
         Args:
             postgres_connection: PostgreSQLConnection instance pointed at the
                 knowledge_base database
+            hnsw_m: HNSW graph degree used when create_tables builds the
+                embedding index
+            hnsw_ef_construction: HNSW build candidate list size. Use
+                hnsw_build_parameters() to pick both for an expected size.
         """
         self._postgres_connection = postgres_connection
+        self._hnsw_m = hnsw_m
+        self._hnsw_ef_construction = hnsw_ef_construction
         self._database_name = postgres_connection._database_name
+        # From pg_class, refreshed by _get_base_ef_search.
+        self._chunk_count_estimate: Optional[int] = None
+        self._chunk_count_estimated_at = 0.0
+        self._chunks_inserted_since_estimate = 0
+
+    @classmethod
+    def hnsw_build_parameters(
+            cls,
+            expected_chunk_count: int) -> Tuple[int, int]:
+        """(hnsw_m, hnsw_ef_construction) for a table expected to hold
+        expected_chunk_count chunks; larger tables need a denser graph to
+        keep recall at the same ef_search."""
+        for max_chunk_count, parameters in \
+                cls.HNSW_BUILD_PARAMETERS_BY_CHUNK_COUNT:
+            if expected_chunk_count < max_chunk_count:
+                return parameters
+        return cls.HNSW_BUILD_PARAMETERS_LARGE
+
+    def connect(self):
+        """Acquire a connection to hand to several calls through their conn
+        argument, e.g. to run them in one transaction."""
+        return self._postgres_connection.connect()
+
+    @asynccontextmanager
+    async def _use_connection(
+            self,
+            conn: Optional[asyncpg.Connection] = None) -> \
+        AsyncGenerator[asyncpg.Connection, None]:
+        """Yield conn if the caller passed one, otherwise a fresh one."""
+        if conn is not None:
+            yield conn
+        else:
+            async with self._postgres_connection.connect() as new_conn:
+                yield new_conn
 
     async def create_tables(self) -> bool:
         """Create the knowledge base tables and indexes if they don't exist."""
@@ -36,8 +139,34 @@ class KnowledgeBaseInterface:
                     KnowledgeBaseSQLStatements.CREATE_DOCUMENTS_TABLE)
                 await conn.execute(
                     KnowledgeBaseSQLStatements.CREATE_CHUNKS_TABLE)
-                await conn.execute(
-                    KnowledgeBaseSQLStatements.CREATE_CHUNKS_INDEXES)
+                # A chunks table created before partitioning is kept as it
+                # is; converting it means reloading every row.
+                chunks_table_kind = await conn.fetchval(
+                    KnowledgeBaseSQLStatements.GET_CHUNKS_TABLE_KIND)
+                if chunks_table_kind == "p":
+                    await conn.execute(
+                        KnowledgeBaseSQLStatements.
+                            build_create_chunks_partitions(
+                                self.CHUNK_PARTITION_COUNT))
+
+                # Tables created before embeddings were stored as float16.
+                embedding_type = await conn.fetchval(
+                    KnowledgeBaseSQLStatements.GET_EMBEDDING_COLUMN_TYPE)
+                if embedding_type.startswith("vector"):
+                    async with conn.transaction():
+                        await conn.execute(
+                            KnowledgeBaseSQLStatements.
+                                MIGRATE_CHUNKS_EMBEDDING_TO_HALFVEC)
+
+                async with conn.transaction():
+                    await conn.execute(
+                        KnowledgeBaseSQLStatements.
+                            SET_LOCAL_MAINTENANCE_WORK_MEM,
+                        self.HNSW_MAINTENANCE_WORK_MEM)
+                    await conn.execute(
+                        KnowledgeBaseSQLStatements.build_create_chunks_indexes(
+                            self._hnsw_m,
+                            self._hnsw_ef_construction))
 
                 return True
         except Exception as e:
@@ -64,7 +193,8 @@ class KnowledgeBaseInterface:
             source_type: Optional[str],
             raw_content: str,
             content_hash: str,
-            metadata: Optional[Dict[str, Any]] = None) -> Optional[int]:
+            metadata: Optional[Dict[str, Any]] = None,
+            conn: Optional[asyncpg.Connection] = None) -> Optional[int]:
         """
         Insert a document record into knowledge_base_documents.
 
@@ -73,7 +203,7 @@ class KnowledgeBaseInterface:
         """
         try:
             metadata_json = json.dumps(metadata) if metadata is not None else None
-            async with self._postgres_connection.connect() as conn:
+            async with self._use_connection(conn) as conn:
                 result = await conn.fetchval(
                     KnowledgeBaseSQLStatements.INSERT_DOCUMENT,
                     title,
@@ -95,7 +225,8 @@ class KnowledgeBaseInterface:
             total_chunks: int,
             content: str,
             content_hash: str,
-            embedding: Optional[List[float]] = None) -> Optional[int]:
+            embedding: Optional[List[float]] = None,
+            conn: Optional[asyncpg.Connection] = None) -> Optional[int]:
         """
         Insert a chunk record into knowledge_base_chunks.
 
@@ -105,7 +236,7 @@ class KnowledgeBaseInterface:
         try:
             embedding_str = PostgreSQLConnection.convert_list_to_string(
                 embedding) if embedding is not None else None
-            async with self._postgres_connection.connect() as conn:
+            async with self._use_connection(conn) as conn:
                 result = await conn.fetchval(
                     KnowledgeBaseSQLStatements.INSERT_CHUNK,
                     document_id,
@@ -120,10 +251,76 @@ class KnowledgeBaseInterface:
             print(f"Error inserting chunk: {e}")
             return None
 
-    async def document_exists_by_hash(self, content_hash: str) -> bool:
+    async def insert_chunks_bulk(
+            self,
+            rows: List[Tuple[int, int, int, str, str, Optional[str]]],
+            conn: Optional[asyncpg.Connection] = None) -> bool:
+        """
+        Insert many chunk records in one round trip and one transaction.
+
+        Args:
+            rows: (document_id, chunk_index, total_chunks, content,
+                content_hash, embedding_str) tuples, where embedding_str is
+                already converted with PostgreSQLConnection.
+                convert_list_to_string (or None).
+            conn: Optional connection to reuse (see connect()).
+
+        Returns:
+            True if every row was inserted, False otherwise (nothing is
+            inserted on failure).
+        """
+        if not rows:
+            return True
+        try:
+            async with self._use_connection(conn) as conn:
+                async with conn.transaction():
+                    await conn.executemany(
+                        KnowledgeBaseSQLStatements.INSERT_CHUNK_BULK,
+                        rows)
+                self._chunks_inserted_since_estimate += len(rows)
+                return True
+        except Exception as e:
+            print(f"Error bulk inserting chunks: {e}")
+            return False
+
+    async def copy_chunks(
+            self,
+            rows: List[Tuple[int, int, int, str, str, Optional[str]]],
+            conn: Optional[asyncpg.Connection] = None) -> bool:
+        """
+        Load many chunk records with COPY FROM STDIN, for large documents.
+
+        Takes the same rows as insert_chunks_bulk. COPY runs in text format
+        so pgvector parses the '[...]' embedding strings itself, without a
+        binary codec for the vector type.
+
+        Returns:
+            True if every row was copied, False otherwise (COPY is atomic).
+        """
+        if not rows:
+            return True
+        try:
+            async with self._use_connection(conn) as conn:
+                await conn.copy_to_table(
+                    self.CHUNKS_TABLE_NAME,
+                    # Wrapped because asyncpg treats a bare bytes source as
+                    # a file path.
+                    source=io.BytesIO(_rows_to_copy_text(rows)),
+                    columns=list(self.CHUNK_COLUMNS),
+                    format="text")
+                self._chunks_inserted_since_estimate += len(rows)
+                return True
+        except Exception as e:
+            print(f"Error copying chunks: {e}")
+            return False
+
+    async def document_exists_by_hash(
+            self,
+            content_hash: str,
+            conn: Optional[asyncpg.Connection] = None) -> bool:
         """Check if a document with the given content hash already exists."""
         try:
-            async with self._postgres_connection.connect() as conn:
+            async with self._use_connection(conn) as conn:
                 result = await conn.fetchval(
                     KnowledgeBaseSQLStatements.GET_DOCUMENT_BY_HASH,
                     content_hash)
@@ -162,11 +359,32 @@ class KnowledgeBaseInterface:
             print(f"Error retrieving document chunks: {e}")
             return []
 
+    async def _get_base_ef_search(self, conn: asyncpg.Connection) -> int:
+        """ef_search for the current table size, estimated from pg_class
+        rather than with a COUNT(*) and re-estimated every
+        EF_SEARCH_REFRESH_SECONDS."""
+        now = time.monotonic()
+        if self._chunk_count_estimate is None or \
+                now - self._chunk_count_estimated_at >= \
+                self.EF_SEARCH_REFRESH_SECONDS:
+            self._chunk_count_estimate = await conn.fetchval(
+                KnowledgeBaseSQLStatements.ESTIMATE_CHUNK_COUNT) or 0
+            self._chunk_count_estimated_at = now
+            self._chunks_inserted_since_estimate = 0
+
+        chunk_count = self._chunk_count_estimate + \
+            self._chunks_inserted_since_estimate
+        for max_chunk_count, ef_search in self.EF_SEARCH_BY_CHUNK_COUNT:
+            if chunk_count < max_chunk_count:
+                return ef_search
+        return self.EF_SEARCH_LARGE
+
     async def vector_similarity_search(
             self,
             query_embedding: List[float],
             similarity_threshold: Optional[float] = None,
-            limit: int = 10) -> List[Dict[str, Any]]:
+            limit: int = 10,
+            ef_search: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Perform cosine similarity search over knowledge base chunks.
 
@@ -174,6 +392,9 @@ class KnowledgeBaseInterface:
             query_embedding: 1024-dimensional query vector
             similarity_threshold: Optional minimum similarity score (0.0 to 1.0)
             limit: Maximum number of results
+            ef_search: hnsw.ef_search for this query. Defaults to a value
+                derived from the table size and limit (see
+                EF_SEARCH_BY_CHUNK_COUNT).
 
         Returns:
             List of dicts with chunk content, document metadata, and similarity_score
@@ -182,28 +403,28 @@ class KnowledgeBaseInterface:
             async with self._postgres_connection.connect() as conn:
                 embedding_str = PostgreSQLConnection.convert_list_to_string(
                     query_embedding)
-                rows = await conn.fetch(
-                    KnowledgeBaseSQLStatements.VECTOR_SIMILARITY_SEARCH,
-                    embedding_str,
-                    similarity_threshold,
-                    limit)
-
-                results = []
-                for row in rows:
-                    results.append({
-                        'id': row['id'],
-                        'document_id': row['document_id'],
-                        'chunk_index': row['chunk_index'],
-                        'total_chunks': row['total_chunks'],
-                        'content': row['content'],
-                        'content_hash': row['content_hash'],
-                        'created_at': row['created_at'],
-                        'title': row['title'],
-                        'source_path': row['source_path'],
-                        'source_type': row['source_type'],
-                        'similarity_score': row['similarity_score']
-                    })
-                return results
+                if ef_search is None:
+                    ef_search = min(
+                        max(
+                            await self._get_base_ef_search(conn),
+                            limit * self.EF_SEARCH_PER_RESULT),
+                        self.EF_SEARCH_MAX)
+
+                # The setting only lasts for this transaction, so it does not
+                # leak into other users of the pooled connection.
+                async with conn.transaction():
+                    await conn.execute(
+                        KnowledgeBaseSQLStatements.SET_LOCAL_HNSW_EF_SEARCH,
+                        str(ef_search))
+                    rows = await conn.fetch(
+                        KnowledgeBaseSQLStatements.VECTOR_SIMILARITY_SEARCH,
+                        embedding_str,
+                        similarity_threshold,
+                        limit)
+
+                # VECTOR_SIMILARITY_SEARCH selects exactly the result keys,
+                # in order.
+                return [dict(row) for row in rows]
         except Exception as e:
             print(f"Error performing vector similarity search: {e}")
             return []
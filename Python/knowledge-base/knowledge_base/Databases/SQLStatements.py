@@ -14,24 +14,61 @@ class KnowledgeBaseSQLStatements:
     );
     """
 
+    # Hash-partitioned by document, so each partition gets its own, smaller
+    # HNSW graph. Keys on a partitioned table must include the partition
+    # key; chunk hashes already embed their document's hash, so
+    # (document_id, content_hash) is as unique as content_hash alone.
     CREATE_CHUNKS_TABLE = """
     CREATE TABLE IF NOT EXISTS knowledge_base_chunks (
-        id SERIAL PRIMARY KEY,
+        id SERIAL,
         document_id INTEGER NOT NULL REFERENCES knowledge_base_documents(id) ON DELETE CASCADE,
         chunk_index INTEGER NOT NULL,
         total_chunks INTEGER NOT NULL,
         content TEXT NOT NULL,
-        content_hash VARCHAR(64) NOT NULL UNIQUE,
-        embedding VECTOR(1024),
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    );
+        content_hash VARCHAR(64) NOT NULL,
+        embedding HALFVEC(1024),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (document_id, id),
+        UNIQUE (document_id, content_hash)
+    ) PARTITION BY HASH (document_id);
+    """
+
+    @staticmethod
+    def build_create_chunks_partitions(partition_count: int) -> str:
+        """CREATE TABLE statements for the partition_count hash partitions
+        knowledge_base_chunks_p0, knowledge_base_chunks_p1, ..."""
+        partition_count = int(partition_count)
+        return "".join(
+            f"""
+    CREATE TABLE IF NOT EXISTS knowledge_base_chunks_p{remainder}
+    PARTITION OF knowledge_base_chunks
+    FOR VALUES WITH (MODULUS {partition_count}, REMAINDER {remainder});
+    """
+            for remainder in range(partition_count))
+
+    # 'p' for a partitioned table, 'r' for a chunks table created before
+    # partitioning.
+    GET_CHUNKS_TABLE_KIND = """
+    SELECT relkind FROM pg_class
+    WHERE oid = 'knowledge_base_chunks'::regclass;
     """
 
-    CREATE_CHUNKS_INDEXES = """
+    @staticmethod
+    def build_create_chunks_indexes(m: int, ef_construction: int) -> str:
+        """CREATE INDEX statements for the chunks table, with the given HNSW
+        build parameters (m = graph degree, ef_construction = candidate list
+        size while building). On the partitioned table each index is built
+        per partition.
+
+        There is deliberately no partial HNSW index on recent chunks: an
+        index predicate must be immutable, so "recent" could only be a fixed
+        created_at cutoff that goes stale, and VECTOR_SIMILARITY_SEARCH has
+        no matching filter for the planner to use it with."""
+        return f"""
     CREATE INDEX IF NOT EXISTS idx_kb_chunks_embedding_hnsw
     ON knowledge_base_chunks
-    USING hnsw (embedding vector_cosine_ops)
-    WITH (m = 16, ef_construction = 64);
+    USING hnsw (embedding halfvec_cosine_ops)
+    WITH (m = {int(m)}, ef_construction = {int(ef_construction)});
 
     CREATE INDEX IF NOT EXISTS idx_kb_chunks_document_id
     ON knowledge_base_chunks(document_id);
@@ -40,6 +77,29 @@ class KnowledgeBaseSQLStatements:
     ON knowledge_base_chunks(chunk_index);
     """
 
+    # Transaction-local, so a pooled connection does not keep the large value.
+    SET_LOCAL_MAINTENANCE_WORK_MEM = """
+    SELECT set_config('maintenance_work_mem', $1, true);
+    """
+
+    # Converts a chunks table created with VECTOR(1024) embeddings. The HNSW
+    # index is tied to vector_cosine_ops, so it is dropped first and rebuilt
+    # by build_create_chunks_indexes afterwards.
+    MIGRATE_CHUNKS_EMBEDDING_TO_HALFVEC = """
+    DROP INDEX IF EXISTS idx_kb_chunks_embedding_hnsw;
+
+    ALTER TABLE knowledge_base_chunks
+    ALTER COLUMN embedding TYPE halfvec(1024)
+    USING embedding::halfvec(1024);
+    """
+
+    GET_EMBEDDING_COLUMN_TYPE = """
+    SELECT format_type(atttypid, atttypmod)
+    FROM pg_attribute
+    WHERE attrelid = 'knowledge_base_chunks'::regclass
+      AND attname = 'embedding';
+    """
+
     INSERT_DOCUMENT = """
     INSERT INTO knowledge_base_documents (
         title, source_path, source_type, raw_content, content_hash, metadata
@@ -56,6 +116,15 @@ class KnowledgeBaseSQLStatements:
     ) RETURNING id;
     """
 
+    # Same row shape as INSERT_CHUNK, for executemany; ids are not returned.
+    INSERT_CHUNK_BULK = """
+    INSERT INTO knowledge_base_chunks (
+        document_id, chunk_index, total_chunks, content, content_hash, embedding
+    ) VALUES (
+        $1, $2, $3, $4, $5, $6
+    );
+    """
+
     GET_DOCUMENT_BY_ID = """
     SELECT id, title, source_path, source_type, raw_content, content_hash,
            metadata, ingested_at
@@ -78,22 +147,62 @@ class KnowledgeBaseSQLStatements:
     ORDER BY chunk_index;
     """
 
+    # Planner estimate of the chunk count, summed over the partitions (the
+    # partitioned parent has no statistics of its own); -1 if an
+    # unpartitioned table was never analyzed.
+    ESTIMATE_CHUNK_COUNT = """
+    SELECT COALESCE(
+        (SELECT sum(GREATEST(c.reltuples, 0))
+         FROM pg_inherits i
+         JOIN pg_class c ON c.oid = i.inhrelid
+         WHERE i.inhparent = 'knowledge_base_chunks'::regclass),
+        (SELECT reltuples FROM pg_class
+         WHERE oid = 'knowledge_base_chunks'::regclass))::bigint;
+    """
+
+    # Transaction-local equivalent of SET LOCAL hnsw.ef_search = $1, which
+    # (unlike SET) accepts a bind parameter.
+    SET_LOCAL_HNSW_EF_SEARCH = """
+    SELECT set_config('hnsw.ef_search', $1::text, true);
+    """
+
+    # The distance is computed once in the subquery, which keeps the plain
+    # ORDER BY embedding <=> $1 LIMIT form that the HNSW indexes serve; on
+    # the partitioned table the per-partition index scans are merged in
+    # distance order. The
+    # threshold is applied afterwards; since it is monotone in the distance,
+    # filtering the nearest $3 rows gives the same result as filtering first.
     VECTOR_SIMILARITY_SEARCH = """
     SELECT
-        c.id,
-        c.document_id,
-        c.chunk_index,
-        c.total_chunks,
-        c.content,
-        c.content_hash,
-        c.created_at,
-        d.title,
-        d.source_path,
-        d.source_type,
-        1 - (c.embedding <=> $1) AS similarity_score
-    FROM knowledge_base_chunks c
-    JOIN knowledge_base_documents d ON c.document_id = d.id
-    WHERE ($2::float IS NULL OR (1 - (c.embedding <=> $1)) >= $2::float)
-    ORDER BY c.embedding <=> $1
-    LIMIT $3;
+        id,
+        document_id,
+        chunk_index,
+        total_chunks,
+        content,
+        content_hash,
+        created_at,
+        title,
+        source_path,
+        source_type,
+        1 - distance AS similarity_score
+    FROM (
+        SELECT
+            c.id,
+            c.document_id,
+            c.chunk_index,
+            c.total_chunks,
+            c.content,
+            c.content_hash,
+            c.created_at,
+            d.title,
+            d.source_path,
+            d.source_type,
+            c.embedding <=> $1::halfvec AS distance
+        FROM knowledge_base_chunks c
+        JOIN knowledge_base_documents d ON c.document_id = d.id
+        ORDER BY c.embedding <=> $1::halfvec
+        LIMIT $3
+    ) AS nearest
+    WHERE ($2::float IS NULL OR 1 - distance >= $2::float)
+    ORDER BY distance;
     """
@@ -1,12 +1,17 @@
 """FastAPI server wrapping pplx-embed-context-v1-0.6b.
 
-Exposes three endpoints:
+Exposes four endpoints:
   POST /embed        — embed a batch of documents (each doc = list of chunks)
-  POST /embed_query  — embed a single query string
+                       as JSON floats, or base64 float16 with
+                       precision="fp16"
+  POST /embed_binary — same as /embed, as raw float16 bytes instead of JSON
+  POST /embed_query  — embed a single query string (concurrent queries are
+                       embedded in one model call, see QueryBatcher)
   GET  /health       — liveness / model-loaded check
 
-All returned embeddings are L2-normalised float32 vectors of dimension 1024,
-ready for pgvector cosine similarity (<=>) without further processing.
+All returned embeddings are L2-normalised vectors of dimension 1024,
+ready for pgvector cosine similarity (<=>) without further processing;
+PplxContextEmbedder.encode already normalises them.
 
 Usage:
     python -m knowledge_base.EmbeddingServer.server
@@ -14,13 +19,16 @@ Usage:
 """
 
 import argparse
+import asyncio
+import base64
 import logging
-from contextlib import asynccontextmanager
-from typing import List
+from contextlib import asynccontextmanager, suppress
+from typing import List, Literal, Optional
 
 import numpy as np
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 from knowledge_base.EmbeddingServer.configuration import (
@@ -28,6 +36,11 @@ from knowledge_base.EmbeddingServer.configuration import (
 )
 from knowledge_base.Embeddings.PplxContextEmbedder import PplxContextEmbedder
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -39,8 +52,11 @@ class EmbedRequest(BaseModel):
 
     chunks: list of documents; each document is a list of chunk strings.
     Example: [["chunk A1", "chunk A2"], ["chunk B1"]]
+    precision: "fp32" for JSON number arrays (EmbedResponse), "fp16" for
+    base64 float16 bytes (EmbedFp16Response). /embed_binary ignores it.
     """
     chunks: List[List[str]]
+    precision: Literal["fp32", "fp16"] = "fp32"
 
 
 class EmbedResponse(BaseModel):
@@ -51,6 +67,16 @@ class EmbedResponse(BaseModel):
     embeddings: List[List[List[float]]]
 
 
+class EmbedFp16Response(BaseModel):
+    """Embeddings per document as base64 little-endian float16 bytes.
+
+    embeddings[i] holds the (num_chunks, embedding_dim) array of document i,
+    row-major; decode with decode_fp16_embeddings.
+    """
+    embeddings: List[str]
+    embedding_dim: int
+
+
 class EmbedQueryRequest(BaseModel):
     """Embed a single query string."""
     query: str
@@ -74,16 +100,96 @@ class HealthResponse(BaseModel):
 
 _embedder: PplxContextEmbedder | None = None
 _server_config: EmbeddingServerConfiguration | None = None
+_query_batcher: "QueryBatcher | None" = None
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _l2_normalize(vec: np.ndarray) -> np.ndarray:
-    """L2-normalise a 1-D or 2-D array along the last axis."""
-    norm = np.linalg.norm(vec, axis=-1, keepdims=True)
-    return vec / np.where(norm == 0, 1.0, norm)
+# /embed_binary body: all chunk embeddings of all documents, row-major, as
+# little-endian float16. The headers carry what is needed to split it again.
+BINARY_MEDIA_TYPE = "application/octet-stream"
+BINARY_DTYPE = np.dtype("<f2")
+CHUNK_COUNTS_HEADER = "X-Chunk-Counts"
+EMBEDDING_DIM_HEADER = "X-Embedding-Dim"
+
+
+def encode_binary_embeddings(
+        embeddings: List[np.ndarray]) -> tuple[bytes, dict[str, str]]:
+    """Pack per-document (num_chunks, dim) arrays into an /embed_binary
+    body and its headers."""
+    body = np.concatenate(embeddings, axis=0).astype(BINARY_DTYPE).tobytes()
+    headers = {
+        CHUNK_COUNTS_HEADER: ",".join(str(len(e)) for e in embeddings),
+        EMBEDDING_DIM_HEADER: str(embeddings[0].shape[-1]),
+    }
+    return body, headers
+
+
+def decode_binary_embeddings(
+        body: bytes,
+        headers) -> List[np.ndarray]:
+    """Inverse of encode_binary_embeddings, for clients: one float16
+    (num_chunks, dim) array per document."""
+    chunk_counts = [int(n) for n in headers[CHUNK_COUNTS_HEADER].split(",")]
+    dim = int(headers[EMBEDDING_DIM_HEADER])
+    flat = np.frombuffer(body, dtype=BINARY_DTYPE).reshape(-1, dim)
+    return np.split(flat, np.cumsum(chunk_counts)[:-1])
+
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def _json_response(content: dict) -> Response:
+    """Serialise a response body of NumPy arrays without building a
+    pydantic model for it.
+
+    With orjson the arrays are written directly; otherwise they are
+    converted with tolist() for the standard json encoder.
+    """
+    if orjson is not None:
+        return Response(
+            content=orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY),
+            media_type=JSON_MEDIA_TYPE)
+    return JSONResponse(content={
+        key: [v.tolist() for v in value] if isinstance(value, list)
+        else value.tolist()
+        for key, value in content.items()})
+
+
+def encode_fp16_embeddings(embeddings: List[np.ndarray]) -> dict:
+    """EmbedFp16Response body for per-document (num_chunks, dim) arrays."""
+    return {
+        "embeddings": [
+            base64.b64encode(e.astype(BINARY_DTYPE).tobytes()).decode("ascii")
+            for e in embeddings],
+        "embedding_dim": int(embeddings[0].shape[-1]),
+    }
+
+
+def decode_fp16_embeddings(body: dict) -> List[np.ndarray]:
+    """Inverse of encode_fp16_embeddings, for clients: one float16
+    (num_chunks, dim) array per document."""
+    dim = body["embedding_dim"]
+    return [
+        np.frombuffer(base64.b64decode(e), dtype=BINARY_DTYPE).reshape(-1, dim)
+        for e in body["embeddings"]]
+
+
+def _validate_embed_request(request: EmbedRequest) -> None:
+    if _embedder is None or not _embedder.is_loaded:
+        raise HTTPException(status_code=503, detail="Model not loaded")
+
+    if not request.chunks:
+        raise HTTPException(
+            status_code=422, detail="chunks must be a non-empty list")
+
+    for i, doc in enumerate(request.chunks):
+        if not doc:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Document at index {i} has no chunks")
 
 
 def _load_embedder(config: EmbeddingServerConfiguration) -> PplxContextEmbedder:
@@ -99,17 +205,88 @@ def _load_embedder(config: EmbeddingServerConfiguration) -> PplxContextEmbedder:
     return embedder
 
 
+# ---------------------------------------------------------------------------
+# Query micro-batching
+# ---------------------------------------------------------------------------
+
+class QueryBatcher:
+    """Embeds concurrent /embed_query requests together.
+
+    A single background task owns the model for queries. Every query that
+    is queued while it is busy with the previous batch goes into the next
+    encode_queries call, up to max_batch_size. A lone query is embedded
+    straight away, so batching adds no latency when the server is idle.
+    """
+
+    def __init__(
+            self,
+            embedder: PplxContextEmbedder,
+            max_batch_size: int = 32):
+        self._embedder = embedder
+        self._max_batch_size = max_batch_size
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+
+    async def embed(self, query: str) -> Optional[np.ndarray]:
+        """Queue a query and wait for its (1024,) embedding, or None if the
+        model failed on its batch."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((query, future))
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            # Let requests that are already being handled enqueue too.
+            await asyncio.sleep(0)
+            while len(batch) < self._max_batch_size and \
+                    not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                # On a worker thread, so other routes keep being served.
+                # Only one batch is in flight: queries arriving meanwhile
+                # wait in the queue and form the next batch.
+                embeddings = await asyncio.to_thread(
+                    self._embedder.encode_queries,
+                    [query for query, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for i, (_, future) in enumerate(batch):
+                if not future.done():
+                    future.set_result(
+                        None if embeddings is None else embeddings[i])
+
+
 # ---------------------------------------------------------------------------
 # FastAPI app
 # ---------------------------------------------------------------------------
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global _embedder
+    global _embedder, _query_batcher
     logger.info("Loading embedding model...")
     _embedder = _load_embedder(_server_config)
+    _query_batcher = QueryBatcher(_embedder)
+    _query_batcher.start()
     logger.info("Model ready.")
     yield
+    await _query_batcher.stop()
+    _query_batcher = None
     _embedder = None
     logger.info("Server shut down.")
 
@@ -132,25 +309,41 @@ async def health():
     )
 
 
-@app.post("/embed", response_model=EmbedResponse)
-async def embed(request: EmbedRequest):
+# The embedding endpoints skip response_model validation, which would check
+# every float of every vector; the models still document the responses.
+@app.post(
+    "/embed",
+    response_model=None,
+    responses={200: {"model": EmbedResponse | EmbedFp16Response}})
+async def embed(request: EmbedRequest) -> Response:
     """Embed a batch of documents.
 
     Each document is a list of chunks.  Returned embeddings are L2-normalised
-    float32 vectors of dimension 1024.
+    float32 vectors of dimension 1024, or float16 base64 bytes per document
+    with precision="fp16" (about a quarter of the JSON size).
     """
-    if _embedder is None or not _embedder.is_loaded:
-        raise HTTPException(status_code=503, detail="Model not loaded")
+    _validate_embed_request(request)
 
-    if not request.chunks:
+    raw: list[np.ndarray] = _embedder.encode(request.chunks)
+    if not raw:
         raise HTTPException(
-            status_code=422, detail="chunks must be a non-empty list")
+            status_code=500,
+            detail="Model returned empty embeddings")
 
-    for i, doc in enumerate(request.chunks):
-        if not doc:
-            raise HTTPException(
-                status_code=422,
-                detail=f"Document at index {i} has no chunks")
+    if request.precision == "fp16":
+        return JSONResponse(content=encode_fp16_embeddings(raw))
+    return _json_response(
+        {"embeddings": [np.ascontiguousarray(doc_embs) for doc_embs in raw]})
+
+
+@app.post("/embed_binary")
+async def embed_binary(request: EmbedRequest):
+    """Embed a batch of documents, returned as raw float16 bytes.
+
+    About a fifth of the size of the JSON from /embed. Decode with
+    decode_binary_embeddings(response.content, response.headers).
+    """
+    _validate_embed_request(request)
 
     raw: list[np.ndarray] = _embedder.encode(request.chunks)
     if not raw:
@@ -158,15 +351,18 @@ async def embed(request: EmbedRequest):
             status_code=500,
             detail="Model returned empty embeddings")
 
-    normalised = [
-        _l2_normalize(doc_embs.astype(np.float32)).tolist()
-        for doc_embs in raw
-    ]
-    return EmbedResponse(embeddings=normalised)
+    body, headers = encode_binary_embeddings(raw)
+    return Response(
+        content=body,
+        media_type=BINARY_MEDIA_TYPE,
+        headers=headers)
 
 
-@app.post("/embed_query", response_model=EmbedQueryResponse)
-async def embed_query(request: EmbedQueryRequest):
+@app.post(
+    "/embed_query",
+    response_model=None,
+    responses={200: {"model": EmbedQueryResponse}})
+async def embed_query(request: EmbedQueryRequest) -> Response:
     """Embed a single query string.
 
     Treats the query as a single-chunk document so it goes through the same
@@ -178,15 +374,19 @@ async def embed_query(request: EmbedQueryRequest):
     if not request.query.strip():
         raise HTTPException(status_code=422, detail="query must not be empty")
 
-    raw = _embedder.encode_single_document([request.query])
-    if raw is None:
+    # Batched with concurrent queries when the server runs with its
+    # lifespan; embedded directly otherwise (e.g. in-process tests).
+    if _query_batcher is not None:
+        vec = await _query_batcher.embed(request.query)
+    else:
+        raw = _embedder.encode_queries([request.query])
+        vec = None if raw is None else raw[0]
+    if vec is None:
         raise HTTPException(
             status_code=500,
             detail="Model returned empty embedding for query")
 
-    # raw shape: (1, 1024) — take the single chunk
-    vec = _l2_normalize(raw[0].astype(np.float32))
-    return EmbedQueryResponse(embedding=vec.tolist())
+    return _json_response({"embedding": np.ascontiguousarray(vec)})
 
 
 # ---------------------------------------------------------------------------
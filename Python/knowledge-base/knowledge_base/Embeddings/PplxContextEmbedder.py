@@ -1,5 +1,8 @@
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
+import hashlib
+import threading
 import numpy as np
 
 
@@ -11,13 +14,19 @@ DEFAULT_MODEL_PATH = (
 
 DEFAULT_DEVICE = "cuda:1"  # RTX 3060 is GPU device 1
 
+# Half precision runs on the 3060's fp16 Tensor Cores and halves VRAM; the
+# embeddings are L2-normalised for cosine similarity, so the precision loss
+# does not matter downstream.
+DEFAULT_DTYPE = "float16"
+
 
 class PplxContextEmbedder:
     """Wrapper around pplx-embed-context-v1-0.6b for document chunk embedding.
 
     The model accepts doc_chunks: list[list[str]] (list of documents, each a
     list of text chunks) and returns a list of numpy arrays shaped
-    (num_chunks, 1024) per document. Embedding dimension is 1024.
+    (num_chunks, 1024) per document. Embedding dimension is 1024. Returned
+    embeddings are L2-normalised float32, ready for cosine similarity.
     """
 
     EMBEDDING_DIM = 1024
@@ -26,31 +35,50 @@ class PplxContextEmbedder:
             self,
             model_path: str = DEFAULT_MODEL_PATH,
             device: str = DEFAULT_DEVICE,
-            chunk_batch_size: int = 32):
+            chunk_batch_size: int = 32,
+            dtype: str = DEFAULT_DTYPE,
+            cache_size: int = 1024):
         """
         Args:
             model_path: Path to the local pplx-embed-context-v1 model directory
             device: Torch device string (e.g. "cuda:1", "cpu")
             chunk_batch_size: Max number of chunks per model.encode() call to
                 avoid CUDA OOM on large documents
+            dtype: Torch dtype name for the model weights on a GPU, e.g.
+                "float16", "bfloat16" or "float32". CPU devices always load
+                float32, since CPUs have no fast half-precision matmuls.
+            cache_size: Number of documents whose embeddings are kept in an
+                in-process LRU cache (0 disables it). The key is the whole
+                chunk list, not single chunks: the model is contextual, so a
+                chunk's embedding depends on its neighbours.
         """
         self._model_path = model_path
         self._device = device
+        self._dtype = dtype
         self._chunk_batch_size = chunk_batch_size
         self._model = None
+        self._cache_size = cache_size
+        self._cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        # encode() is called from worker threads (asyncio.to_thread), so
+        # every cache read, reorder and eviction happens under this lock.
+        self._cache_lock = threading.Lock()
 
     def load(self) -> bool:
         """Load the model onto the target device. Returns True on success."""
         try:
+            import torch
             from transformers import AutoModel
             print(f"Loading pplx-embed-context model from {self._model_path} ...")
+            dtype_name = "float32" if self._device.startswith("cpu") \
+                else self._dtype
             self._model = AutoModel.from_pretrained(
                 Path(self._model_path),
                 trust_remote_code=True,
+                torch_dtype=getattr(torch, dtype_name),
             )
             self._model = self._model.to(self._device)
             self._model.eval()
-            print(f"Model loaded on {self._device}")
+            print(f"Model loaded on {self._device} ({dtype_name})")
             return True
         except Exception as e:
             print(f"Error loading model: {e}")
@@ -60,6 +88,50 @@ class PplxContextEmbedder:
     def is_loaded(self) -> bool:
         return self._model is not None
 
+    @staticmethod
+    def _l2_normalize_in_place(embeddings: np.ndarray) -> np.ndarray:
+        """L2-normalise rows of a float array without allocating a copy;
+        zero rows are left as zero."""
+        norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        embeddings /= norms
+        return embeddings
+
+    @staticmethod
+    def _cache_key(chunks: List[str]) -> bytes:
+        """Digest of a document's chunk list. Each chunk is length-prefixed
+        so different splits of the same text do not collide; blake2b is a
+        fast non-security hash from the standard library."""
+        hasher = hashlib.blake2b(digest_size=16)
+        for chunk in chunks:
+            chunk_bytes = chunk.encode("utf-8")
+            hasher.update(len(chunk_bytes).to_bytes(8, "little"))
+            hasher.update(chunk_bytes)
+        return hasher.digest()
+
+    def _store_in_cache(self, entries: Dict[bytes, np.ndarray]) -> None:
+        """Insert read-only embeddings as most recently used, evicting the
+        least recently used beyond cache_size."""
+        with self._cache_lock:
+            for key, embeddings in entries.items():
+                self._cache[key] = embeddings
+                self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def _encode_document(self, chunks: List[str]) -> np.ndarray:
+        sub_arrays = []
+        for i in range(0, len(chunks), self._chunk_batch_size):
+            sub_batch = chunks[i:i + self._chunk_batch_size]
+            batch_result = self._model.encode([sub_batch])
+            # Half-precision weights give half-precision output; callers get
+            # float32 as before.
+            sub_arrays.append(np.asarray(batch_result[0], dtype=np.float32))
+        # concatenate returns a fresh array, so normalise it in place right
+        # away rather than in a later pass.
+        return self._l2_normalize_in_place(
+            np.concatenate(sub_arrays, axis=0))
+
     def encode(
             self,
             doc_chunks: List[List[str]]) -> List[np.ndarray]:
@@ -71,26 +143,95 @@ class PplxContextEmbedder:
                 strings.
 
         Returns:
-            List of numpy arrays, one per document, each shaped
-            (num_chunks, 1024).
+            List of L2-normalised float32 numpy arrays, one per document,
+            each shaped (num_chunks, 1024).
         """
         if not self.is_loaded:
             raise RuntimeError(
                 "Model not loaded. Call load() before encode().")
         try:
+            import torch
             results = []
-            for chunks in doc_chunks:
-                sub_arrays = []
-                for i in range(0, len(chunks), self._chunk_batch_size):
-                    sub_batch = chunks[i:i + self._chunk_batch_size]
-                    batch_result = self._model.encode([sub_batch])
-                    sub_arrays.append(batch_result[0])
-                results.append(np.concatenate(sub_arrays, axis=0))
+            # inference_mode skips autograd bookkeeping for every forward.
+            with torch.inference_mode():
+                for chunks in doc_chunks:
+                    if self._cache_size <= 0:
+                        results.append(self._encode_document(chunks))
+                        continue
+
+                    key = self._cache_key(chunks)
+                    with self._cache_lock:
+                        embeddings = self._cache.get(key)
+                        if embeddings is not None:
+                            self._cache.move_to_end(key)
+                    if embeddings is None:
+                        # The model runs outside the lock.
+                        embeddings = self._encode_document(chunks)
+                        # Shared between callers, so make it read-only.
+                        embeddings.flags.writeable = False
+                        self._store_in_cache({key: embeddings})
+                    results.append(embeddings)
             return results
         except Exception as e:
             print(f"Error encoding documents: {e}")
             return []
 
+    def encode_queries(self, queries: List[str]) -> Optional[np.ndarray]:
+        """
+        Embed independent query strings, each as its own one-chunk document,
+        with up to chunk_batch_size queries per model call (encode() makes
+        one model call per document).
+
+        Args:
+            queries: Query strings.
+
+        Returns:
+            L2-normalised float32 numpy array of shape (num_queries, 1024),
+            or None on failure.
+        """
+        if not self.is_loaded:
+            raise RuntimeError(
+                "Model not loaded. Call load() before encode_queries().")
+        try:
+            import torch
+            embeddings = np.empty(
+                (len(queries), self.EMBEDDING_DIM),
+                dtype=np.float32)
+            keys = [self._cache_key([query]) for query in queries]
+            misses = []
+            with self._cache_lock:
+                for i, key in enumerate(keys):
+                    cached = self._cache.get(key) if self._cache_size > 0 \
+                        else None
+                    if cached is None:
+                        misses.append(i)
+                    else:
+                        self._cache.move_to_end(key)
+                        embeddings[i] = cached[0]
+
+            with torch.inference_mode():
+                for start in range(0, len(misses), self._chunk_batch_size):
+                    batch = misses[start:start + self._chunk_batch_size]
+                    batch_result = self._model.encode(
+                        [[queries[i]] for i in batch])
+                    for i, query_embedding in zip(batch, batch_result):
+                        embeddings[i] = np.asarray(
+                            query_embedding,
+                            dtype=np.float32)[0]
+            self._l2_normalize_in_place(embeddings)
+
+            if self._cache_size > 0:
+                new_entries = {}
+                for i in misses:
+                    cached = embeddings[i:i + 1].copy()
+                    cached.flags.writeable = False
+                    new_entries[keys[i]] = cached
+                self._store_in_cache(new_entries)
+            return embeddings
+        except Exception as e:
+            print(f"Error encoding queries: {e}")
+            return None
+
     def encode_single_document(self, chunks: List[str]) -> Optional[np.ndarray]:
         """
         Embed a single document's chunks.
@@ -99,7 +240,8 @@ class PplxContextEmbedder:
             chunks: List of text chunks for one document.
 
         Returns:
-            numpy array of shape (num_chunks, 1024), or None on failure.
+            L2-normalised float32 numpy array of shape (num_chunks, 1024), or
+            None on failure.
         """
         if not self.is_loaded:
             raise RuntimeError(
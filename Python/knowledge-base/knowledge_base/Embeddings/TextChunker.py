@@ -32,17 +32,16 @@ class TextChunker:
         if overlap >= chunk_size:
             raise ValueError("overlap must be less than chunk_size")
 
-        chunks = []
-        start = 0
+        # Chunk k covers [k * step, k * step + chunk_size); the last chunk is
+        # the first one that reaches the end of the text.
         text_length = len(text)
-
-        while start < text_length:
-            end = min(start + chunk_size, text_length)
-            chunk = text[start:end].strip()
-            if chunk:
-                chunks.append(chunk)
-            if end == text_length:
-                break
-            start = end - overlap
-
-        return chunks
+        step = chunk_size - overlap
+        if text_length <= chunk_size:
+            num_chunks = 1
+        else:
+            num_chunks = -(-(text_length - chunk_size) // step) + 1
+
+        pieces = (
+            text[start:start + chunk_size].strip()
+            for start in range(0, num_chunks * step, step))
+        return [chunk for chunk in pieces if chunk]
@@ -1,16 +1,84 @@
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
+import asyncio
 import hashlib
+import numpy as np
 
+from ..Databases.PostgreSQLConnection import PostgreSQLConnection
 from ..Databases.PostgreSQLInterface import KnowledgeBaseInterface
 from ..Embeddings.PplxContextEmbedder import PplxContextEmbedder
 from ..Embeddings.TextChunker import TextChunker
 from .FileIngester import FileIngester
 
 
+# Characters of text encoded per sha256 update in hash_text.
+HASH_BLOCK_CHARS = 1 << 20
+
+
+def hash_text(text: str) -> str:
+    """
+    sha256 hex digest of text's UTF-8 encoding.
+
+    The text is encoded a block at a time, so hashing a large document does
+    not allocate a second full-size copy of it as bytes.
+    """
+    hasher = hashlib.sha256()
+    for start in range(0, len(text), HASH_BLOCK_CHARS):
+        hasher.update(
+            text[start:start + HASH_BLOCK_CHARS].encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def prepare_chunk_fields(
+        content_hash: str,
+        chunks: List[str],
+        embeddings: Optional[np.ndarray]) \
+        -> List[Tuple[int, int, str, str, Optional[str]]]:
+    """
+    Build the per-chunk insert fields for one document in a single pass.
+
+    Returns:
+        (chunk_index, total_chunks, content, content_hash, embedding_str)
+        tuples; prepend the document id to get insert_chunks_bulk rows.
+    """
+    total_chunks = len(chunks)
+    # Chunk hashes are sha256(f"{content_hash}:{i}:{chunk_text}"); the shared
+    # prefix is hashed once and its state copied per chunk.
+    prefix_hash = hashlib.sha256(f"{content_hash}:".encode("utf-8"))
+    embedding_strs = []
+    if embeddings is not None and len(embeddings):
+        embedding_strs = PostgreSQLConnection.convert_array_to_strings(
+            embeddings)
+    num_embeddings = len(embedding_strs)
+
+    chunk_fields = []
+    for i, chunk_text in enumerate(chunks):
+        chunk_hasher = prefix_hash.copy()
+        chunk_hasher.update(b"%d:" % i)
+        chunk_hasher.update(chunk_text.encode("utf-8"))
+
+        embedding_str = embedding_strs[i] if i < num_embeddings else None
+
+        chunk_fields.append((
+            i,
+            total_chunks,
+            chunk_text,
+            chunk_hasher.hexdigest(),
+            embedding_str))
+    return chunk_fields
+
+
+class _RollbackDocument(Exception):
+    """Raised inside process_text's transaction to roll it back."""
+
+
 class DocumentProcessor:
     """Orchestrates file ingestion, chunking, embedding, and DB persistence."""
 
+    # Documents with more chunks than this are loaded with COPY rather than
+    # executemany.
+    COPY_CHUNKS_THRESHOLD = 50
+
     def __init__(
             self,
             embedder: PplxContextEmbedder,
@@ -41,7 +109,7 @@ class DocumentProcessor:
             The document ID on success, or None on failure / duplicate.
         """
         file_path = Path(file_path)
-        doc_data = self._file_ingester.ingest_file(file_path)
+        doc_data = await self._file_ingester.ingest_file_async(file_path)
         if doc_data is None:
             return None
 
@@ -66,57 +134,82 @@ class DocumentProcessor:
         Returns:
             The document ID on success, or None on failure / duplicate.
         """
-        content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
-
-        already_exists = await self._db.document_exists_by_hash(content_hash)
-        if already_exists:
-            print(f"Document already exists (hash={content_hash}), skipping.")
+        content_hash = hash_text(text)
+
+        # The connection is opened first, so an unreachable database fails
+        # before any GPU time is spent on embedding.
+        try:
+            async with self._db.connect() as conn:
+                already_exists = await self._db.document_exists_by_hash(
+                    content_hash,
+                    conn=conn)
+                if already_exists:
+                    print(
+                        f"Document already exists (hash={content_hash}), "
+                        "skipping.")
+                    return None
+
+                chunks = self._chunker.chunk_text(
+                    text,
+                    chunk_size=self._chunk_size,
+                    overlap=self._overlap)
+
+                # Embedding and the per-chunk CPU work run off the event
+                # loop, so other documents keep being processed meanwhile.
+                embeddings_list = None
+                if chunks:
+                    embeddings_list = await asyncio.to_thread(
+                        self._embedder.encode_single_document,
+                        chunks)
+
+                total_chunks = len(chunks)
+                chunk_fields = await asyncio.to_thread(
+                    prepare_chunk_fields,
+                    content_hash,
+                    chunks,
+                    embeddings_list)
+
+                # The document and its chunks are committed together or not
+                # at all.
+                async with conn.transaction():
+                    document_id = await self._db.insert_document(
+                        title=title,
+                        source_path=source_path,
+                        source_type=source_type,
+                        raw_content=text,
+                        content_hash=content_hash,
+                        metadata=metadata,
+                        conn=conn
+                    )
+                    if document_id is None:
+                        raise _RollbackDocument(
+                            "Failed to insert document record.")
+
+                    if not chunks:
+                        print("No chunks produced from text.")
+                        return document_id
+
+                    rows = [
+                        (document_id,) + fields for fields in chunk_fields]
+                    if total_chunks > self.COPY_CHUNKS_THRESHOLD:
+                        inserted = await self._db.copy_chunks(
+                            rows,
+                            conn=conn)
+                    else:
+                        inserted = await self._db.insert_chunks_bulk(
+                            rows,
+                            conn=conn)
+                    if not inserted:
+                        raise _RollbackDocument(
+                            "Failed to insert chunks for document "
+                            f"{document_id}")
+        except _RollbackDocument as e:
+            print(e)
             return None
-
-        document_id = await self._db.insert_document(
-            title=title,
-            source_path=source_path,
-            source_type=source_type,
-            raw_content=text,
-            content_hash=content_hash,
-            metadata=metadata
-        )
-        if document_id is None:
-            print("Failed to insert document record.")
+        except Exception as e:
+            print(f"Error processing document '{title}': {e}")
             return None
 
-        chunks = self._chunker.chunk_text(
-            text,
-            chunk_size=self._chunk_size,
-            overlap=self._overlap)
-
-        if not chunks:
-            print("No chunks produced from text.")
-            return document_id
-
-        embeddings_list = self._embedder.encode_single_document(chunks)
-
-        total_chunks = len(chunks)
-        for i, chunk_text in enumerate(chunks):
-            chunk_hash = hashlib.sha256(
-                f"{content_hash}:{i}:{chunk_text}".encode("utf-8")
-            ).hexdigest()
-
-            embedding = None
-            if embeddings_list is not None and i < len(embeddings_list):
-                embedding = embeddings_list[i].tolist()
-
-            chunk_id = await self._db.insert_chunk(
-                document_id=document_id,
-                chunk_index=i,
-                total_chunks=total_chunks,
-                content=chunk_text,
-                content_hash=chunk_hash,
-                embedding=embedding
-            )
-            if chunk_id is None:
-                print(f"Failed to insert chunk {i} for document {document_id}")
-
         print(
             f"Processed document '{title}' -> id={document_id}, "
             f"{total_chunks} chunks."
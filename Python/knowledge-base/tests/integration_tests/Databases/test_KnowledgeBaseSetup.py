@@ -15,11 +15,21 @@ Then run tests from the project root:
 """
 
 from pathlib import Path
+import json
+import numpy as np
+import os
 from knowledge_base.Databases.Configuration import (
     KnowledgeBaseSetupData,
     KnowledgeBaseSetup,
 )
+from knowledge_base.Databases.PostgreSQLConnection import PostgreSQLConnection
 from knowledge_base.Databases.PostgreSQLInterface import KnowledgeBaseInterface
+from knowledge_base.Databases.SQLStatements import KnowledgeBaseSQLStatements
+from knowledge_base.Embeddings.TextChunker import TextChunker
+from knowledge_base.Ingestion.DocumentProcessor import (
+    DocumentProcessor,
+    hash_text,
+)
 import pytest
 
 test_configuration_path = Path(__file__).parents[2] / \
@@ -35,6 +45,25 @@ def test_KnowledgeBaseSetupData_from_yaml_works():
     assert test_setup_data.postgres_password == "inserviceofx"
     assert test_setup_data.database_names == \
         {"KnowledgeBase": "test_knowledge_base"}
+    assert test_setup_data.pool_min_size == 10
+    assert test_setup_data.pool_max_size == 50
+    assert test_setup_data.pool_max_inactive_connection_lifetime == 0.0
+
+
+def test_KnowledgeBaseSetupData_from_yaml_rereads_modified_file(tmp_path):
+    yaml_path = tmp_path / "configuration.yml"
+    yaml_path.write_text(
+        test_configuration_path.read_text().replace("5432", "5433"))
+    first = KnowledgeBaseSetupData.from_yaml(yaml_path)
+    second = KnowledgeBaseSetupData.from_yaml(yaml_path)
+    assert first.database_port == 5433
+    assert first.database_names == second.database_names
+    assert first.database_names is not second.database_names
+
+    yaml_path.write_text(test_configuration_path.read_text())
+    stat = yaml_path.stat()
+    os.utime(yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert KnowledgeBaseSetupData.from_yaml(yaml_path).database_port == 5432
 
 
 def test_KnowledgeBaseSetupData_from_default_values_works():
@@ -55,6 +84,39 @@ def test_KnowledgeBaseSetupData_get_dsn_works():
     assert "5432" in dsn
 
 
+def test_KnowledgeBaseSetup_get_connection_is_lazy():
+    setup = KnowledgeBaseSetup(test_setup_data)
+    assert setup._connections == {}
+
+    connection = setup._get_connection("KnowledgeBase")
+    assert setup._connections == {"KnowledgeBase": connection}
+    assert setup._get_connection("KnowledgeBase") is connection
+
+    with pytest.raises(KeyError):
+        setup._get_connection("NotADatabaseType")
+    assert "NotADatabaseType" not in setup._connections
+
+
+def test_KnowledgeBaseInterface_hnsw_build_parameters_grow_with_scale():
+    assert KnowledgeBaseInterface.hnsw_build_parameters(10_000) == (16, 64)
+    assert KnowledgeBaseInterface.hnsw_build_parameters(500_000) == (24, 100)
+    assert KnowledgeBaseInterface.hnsw_build_parameters(5_000_000) == \
+        (32, 128)
+    assert "WITH (m = 24, ef_construction = 100)" in \
+        KnowledgeBaseSQLStatements.build_create_chunks_indexes(24, 100)
+
+
+def test_PostgreSQLConnection_convert_array_to_strings_round_trips():
+    embeddings = np.random.default_rng(0).standard_normal(
+        (3, 1024)).astype(np.float32)
+    strings = PostgreSQLConnection.convert_array_to_strings(embeddings)
+    assert len(strings) == 3
+    for string, row in zip(strings, embeddings):
+        assert string.startswith("[") and string.endswith("]")
+        parsed = np.array(json.loads(string), dtype=np.float32)
+        assert np.array_equal(parsed, row)
+
+
 @pytest.mark.asyncio
 async def test_KnowledgeBaseSetup_creates_postgresql_connection_from_database_type():
     setup = KnowledgeBaseSetup(test_setup_data)
@@ -94,6 +156,10 @@ async def test_KnowledgeBaseSetup_create_pool_for_database_creates():
         database_name) is True, \
         f"Database {database_name} should exist now!"
 
+    pool_status = setup._connections["KnowledgeBase"].pool_status()
+    assert pool_status["max_size"] == test_setup_data.pool_max_size
+    assert pool_status["in_use"] == 0
+
     # Verify vector extension was created
     extension_exists = await setup._connections["KnowledgeBase"].extension_exists(
         "vector")
@@ -125,6 +191,10 @@ async def test_KnowledgeBaseInterface_create_tables():
 
         chunks_exist = await interface.table_exists("knowledge_base_chunks")
         assert chunks_exist is True, "knowledge_base_chunks table should exist"
+
+        for remainder in range(KnowledgeBaseInterface.CHUNK_PARTITION_COUNT):
+            assert await interface.table_exists(
+                f"knowledge_base_chunks_p{remainder}") is True
     finally:
         await connection.drop_database(database_name)
 
@@ -214,3 +284,123 @@ async def test_KnowledgeBaseInterface_insert_chunk_and_similarity_search():
         assert "similarity_score" in results[0]
     finally:
         await connection.drop_database(database_name)
+
+
+@pytest.mark.asyncio
+async def test_KnowledgeBaseInterface_insert_chunks_bulk():
+    setup = KnowledgeBaseSetup(test_setup_data)
+    setup.create_postgresql_connection(database_type="KnowledgeBase")
+    database_name = test_setup_data.database_names["KnowledgeBase"]
+
+    await setup.create_pool_for_database(database_type="KnowledgeBase")
+    connection = setup._connections["KnowledgeBase"]
+
+    try:
+        interface = KnowledgeBaseInterface(connection)
+        await interface.create_tables()
+
+        doc_id = await interface.insert_document(
+            title="Bulk Test Doc",
+            source_path=None,
+            source_type="text",
+            raw_content="Bulk chunk insert test.",
+            content_hash="bulktest" + "0" * 56,
+            metadata=None
+        )
+        assert doc_id is not None
+
+        embedding_str = connection.convert_list_to_string([0.1] * 1024)
+        rows = [
+            (doc_id, i, 3, f"Chunk {i}.", f"bulkchunk{i}" + "0" * 54,
+             embedding_str)
+            for i in range(3)
+        ]
+        assert await interface.insert_chunks_bulk(rows) is True
+
+        chunks = await interface.get_document_chunks(doc_id)
+        assert [chunk["content"] for chunk in chunks] == \
+            ["Chunk 0.", "Chunk 1.", "Chunk 2."]
+
+        # A duplicate content_hash fails the whole batch, not just one row.
+        rows = [
+            (doc_id, 3, 5, "Chunk 3.", "bulkchunk3" + "0" * 54, None),
+            (doc_id, 4, 5, "Chunk 4.", "bulkchunk0" + "0" * 54, None),
+        ]
+        assert await interface.insert_chunks_bulk(rows) is False
+        assert len(await interface.get_document_chunks(doc_id)) == 3
+    finally:
+        await connection.drop_database(database_name)
+
+
+@pytest.mark.asyncio
+async def test_KnowledgeBaseInterface_copy_chunks():
+    setup = KnowledgeBaseSetup(test_setup_data)
+    setup.create_postgresql_connection(database_type="KnowledgeBase")
+    database_name = test_setup_data.database_names["KnowledgeBase"]
+
+    await setup.create_pool_for_database(database_type="KnowledgeBase")
+    connection = setup._connections["KnowledgeBase"]
+
+    try:
+        interface = KnowledgeBaseInterface(connection)
+        await interface.create_tables()
+
+        doc_id = await interface.insert_document(
+            title="Copy Test Doc",
+            source_path=None,
+            source_type="text",
+            raw_content="COPY chunk test.",
+            content_hash="copytest" + "0" * 56,
+            metadata=None
+        )
+        assert doc_id is not None
+
+        embedding_str = connection.convert_list_to_string([0.1] * 1024)
+        rows = [
+            (doc_id, 0, 2, "Tab\there,\nnewline \\ backslash",
+             "copychunk0" + "0" * 54, embedding_str),
+            (doc_id, 1, 2, "No embedding.", "copychunk1" + "0" * 54, None),
+        ]
+        assert await interface.copy_chunks(rows) is True
+
+        chunks = await interface.get_document_chunks(doc_id)
+        assert [chunk["content"] for chunk in chunks] == \
+            [rows[0][3], rows[1][3]]
+        assert chunks[0]["embedding"] is not None
+        assert chunks[1]["embedding"] is None
+    finally:
+        await connection.drop_database(database_name)
+
+
+@pytest.mark.asyncio
+async def test_DocumentProcessor_process_text_rolls_back_document_on_chunk_failure():
+    setup = KnowledgeBaseSetup(test_setup_data)
+    setup.create_postgresql_connection(database_type="KnowledgeBase")
+    database_name = test_setup_data.database_names["KnowledgeBase"]
+
+    await setup.create_pool_for_database(database_type="KnowledgeBase")
+    connection = setup._connections["KnowledgeBase"]
+
+    class WrongDimensionEmbedder:
+        # The chunks table stores halfvec(1024), so 8-dim rows fail.
+        def encode_single_document(self, chunks):
+            return np.ones((len(chunks), 8), dtype=np.float32)
+
+    try:
+        interface = KnowledgeBaseInterface(connection)
+        await interface.create_tables()
+
+        processor = DocumentProcessor(
+            WrongDimensionEmbedder(),
+            TextChunker(),
+            interface,
+            chunk_size=20,
+            overlap=5)
+        text = "A document whose chunks cannot be inserted."
+        assert await processor.process_text(text, "Rollback", "text") is None
+
+        # The document row was inserted first, then rolled back with them.
+        assert await interface.document_exists_by_hash(hash_text(text)) \
+            is False
+    finally:
+        await connection.drop_database(database_name)
@@ -10,6 +10,7 @@ Run from the project root:
 """
 
 from pathlib import Path
+import asyncio
 
 import numpy as np
 import pytest
@@ -55,6 +56,49 @@ def loaded_app(server_config):
     srv._embedder = None
 
 
+@pytest.fixture(scope="module")
+def client(loaded_app):
+    """One AsyncClient shared by the model tests. Callers of the server
+    should likewise keep a client open rather than create one per request."""
+    import httpx
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=loaded_app),
+        base_url="http://test",
+    )
+    yield client
+    asyncio.run(client.aclose())
+
+
+class FakeEmbedder:
+    """Stands in for PplxContextEmbedder: the same random 8-dim embeddings
+    for the same chunk counts, without loading the model."""
+    is_loaded = True
+
+    def encode(self, doc_chunks):
+        rng = np.random.default_rng(0)
+        return [
+            rng.standard_normal((len(chunks), 8)).astype(np.float32)
+            for chunks in doc_chunks]
+
+
+@pytest_asyncio.fixture
+async def fake_client():
+    """AsyncClient for the app with FakeEmbedder in place of the model."""
+    import httpx
+    import knowledge_base.EmbeddingServer.server as srv
+
+    srv._server_config = EmbeddingServerConfiguration.from_defaults()
+    previous_embedder, srv._embedder = srv._embedder, FakeEmbedder()
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=srv.app),
+            base_url="http://test",
+        ) as client:
+            yield client
+    finally:
+        srv._embedder = previous_embedder
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -69,13 +113,8 @@ def test_server_config_defaults():
 
 @skip_if_no_model
 @pytest.mark.asyncio
-async def test_health_endpoint_model_loaded(loaded_app):
-    import httpx
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=loaded_app),
-        base_url="http://test",
-    ) as client:
-        response = await client.get("/health")
+async def test_health_endpoint_model_loaded(client):
+    response = await client.get("/health")
     assert response.status_code == 200
     body = response.json()
     assert body["status"] == "ok"
@@ -84,14 +123,9 @@ async def test_health_endpoint_model_loaded(loaded_app):
 
 @skip_if_no_model
 @pytest.mark.asyncio
-async def test_embed_single_document(loaded_app):
-    import httpx
+async def test_embed_single_document(client):
     payload = {"chunks": [["First chunk.", "Second chunk.", "Third chunk."]]}
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=loaded_app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/embed", json=payload)
+    response = await client.post("/embed", json=payload)
     assert response.status_code == 200
     body = response.json()
     embeddings = body["embeddings"]
@@ -99,27 +133,21 @@ async def test_embed_single_document(loaded_app):
     assert len(embeddings[0]) == 3        # three chunks
     assert len(embeddings[0][0]) == 1024  # 1024-dim vectors
 
-    # Verify L2-normalised (norm ≈ 1.0)
-    for vec in embeddings[0]:
-        norm = float(np.linalg.norm(vec))
-        assert abs(norm - 1.0) < 1e-4, f"Expected unit norm, got {norm}"
+    # Verify L2-normalised (norm ≈ 1.0), all chunks in one call
+    norms = np.linalg.norm(np.asarray(embeddings[0]), axis=-1)
+    np.testing.assert_allclose(norms, 1.0, rtol=0, atol=1e-4)
 
 
 @skip_if_no_model
 @pytest.mark.asyncio
-async def test_embed_multiple_documents(loaded_app):
-    import httpx
+async def test_embed_multiple_documents(client):
     payload = {
         "chunks": [
             ["Doc A chunk 1.", "Doc A chunk 2."],
             ["Doc B only chunk."],
         ]
     }
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=loaded_app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/embed", json=payload)
+    response = await client.post("/embed", json=payload)
     assert response.status_code == 200
     body = response.json()
     assert len(body["embeddings"]) == 2
@@ -129,14 +157,9 @@ async def test_embed_multiple_documents(loaded_app):
 
 @skip_if_no_model
 @pytest.mark.asyncio
-async def test_embed_query(loaded_app):
-    import httpx
+async def test_embed_query(client):
     payload = {"query": "What is the capital of France?"}
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=loaded_app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/embed_query", json=payload)
+    response = await client.post("/embed_query", json=payload)
     assert response.status_code == 200
     body = response.json()
     assert len(body["embedding"]) == 1024
@@ -161,3 +184,164 @@ async def test_embed_empty_chunks_returns_422():
     ) as client:
         response = await client.post("/embed", json=payload)
     assert response.status_code in (422, 503)
+
+
+@pytest.mark.asyncio
+async def test_embed_binary_round_trips_through_decode(fake_client):
+    """/embed_binary returns float16 bytes that decode back per document."""
+    import knowledge_base.EmbeddingServer.server as srv
+
+    payload = {"chunks": [["A1", "A2"], ["B1"]]}
+    response = await fake_client.post("/embed_binary", json=payload)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == srv.BINARY_MEDIA_TYPE
+    decoded = srv.decode_binary_embeddings(
+        response.content, response.headers)
+    expected = FakeEmbedder().encode(payload["chunks"])
+    assert [d.shape for d in decoded] == [(2, 8), (1, 8)]
+    for got, want in zip(decoded, expected):
+        np.testing.assert_allclose(got, want, rtol=1e-3, atol=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_embed_returns_embeddings_as_json(fake_client):
+    """/embed serialises the embedder's arrays without loss."""
+    payload = {"chunks": [["A1", "A2"], ["B1"]]}
+    response = await fake_client.post("/embed", json=payload)
+
+    assert response.status_code == 200
+    embeddings = response.json()["embeddings"]
+    expected = FakeEmbedder().encode(payload["chunks"])
+    for got, want in zip(embeddings, expected):
+        np.testing.assert_array_equal(np.array(got, dtype=np.float32), want)
+
+
+@pytest.mark.asyncio
+async def test_embed_fp16_round_trips_through_decode(fake_client):
+    """/embed with precision="fp16" returns base64 float16 per document."""
+    import knowledge_base.EmbeddingServer.server as srv
+
+    payload = {"chunks": [["A1", "A2"], ["B1"]], "precision": "fp16"}
+    response = await fake_client.post("/embed", json=payload)
+
+    assert response.status_code == 200
+    decoded = srv.decode_fp16_embeddings(response.json())
+    expected = FakeEmbedder().encode(payload["chunks"])
+    assert [d.shape for d in decoded] == [(2, 8), (1, 8)]
+    for got, want in zip(decoded, expected):
+        np.testing.assert_allclose(
+            got.astype(np.float32), want, rtol=1e-3, atol=1e-3)
+
+
+class CountingQueryEmbedder:
+    """encode_queries returns row i filled with float(i) and records each
+    call's queries; with fail set it raises instead."""
+
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def encode_queries(self, queries):
+        self.calls.append(list(queries))
+        if self.fail:
+            raise RuntimeError("model failed")
+        return np.repeat(
+            np.arange(len(queries), dtype=np.float32)[:, None], 4, axis=1)
+
+
+@pytest.mark.asyncio
+async def test_QueryBatcher_merges_concurrent_queries_into_one_call():
+    from knowledge_base.EmbeddingServer.server import QueryBatcher
+
+    embedder = CountingQueryEmbedder()
+    batcher = QueryBatcher(embedder, max_batch_size=32)
+    batcher.start()
+    try:
+        queries = [f"query {i}" for i in range(10)]
+        results = await asyncio.gather(
+            *(batcher.embed(query) for query in queries))
+    finally:
+        await batcher.stop()
+
+    assert embedder.calls == [queries]
+    for i, row in enumerate(results):
+        np.testing.assert_array_equal(row, np.full(4, i, dtype=np.float32))
+
+
+@pytest.mark.asyncio
+async def test_QueryBatcher_splits_at_max_batch_size():
+    from knowledge_base.EmbeddingServer.server import QueryBatcher
+
+    embedder = CountingQueryEmbedder()
+    batcher = QueryBatcher(embedder, max_batch_size=4)
+    batcher.start()
+    try:
+        results = await asyncio.gather(
+            *(batcher.embed(f"query {i}") for i in range(10)))
+    finally:
+        await batcher.stop()
+
+    assert [len(call) for call in embedder.calls] == [4, 4, 2]
+    assert [float(row[0]) for row in results] == \
+        [0, 1, 2, 3, 0, 1, 2, 3, 0, 1]
+
+
+@pytest.mark.asyncio
+async def test_QueryBatcher_raises_model_error_in_every_waiter():
+    from knowledge_base.EmbeddingServer.server import QueryBatcher
+
+    embedder = CountingQueryEmbedder(fail=True)
+    batcher = QueryBatcher(embedder)
+    batcher.start()
+    try:
+        results = await asyncio.gather(
+            *(batcher.embed(f"query {i}") for i in range(5)),
+            return_exceptions=True)
+        # The worker survives a failed batch.
+        embedder.fail = False
+        assert (await batcher.embed("after"))[0] == 0.0
+    finally:
+        await batcher.stop()
+
+    assert len(embedder.calls) == 2
+    assert all(
+        isinstance(result, RuntimeError) and str(result) == "model failed"
+        for result in results)
+
+
+@pytest.mark.asyncio
+async def test_QueryBatcher_keeps_event_loop_free_during_a_batch():
+    import threading
+    from knowledge_base.EmbeddingServer.server import QueryBatcher
+
+    started = threading.Event()
+    release = threading.Event()
+
+    class BlockingEmbedder(CountingQueryEmbedder):
+        def encode_queries(self, queries):
+            if not started.is_set():
+                started.set()
+                release.wait(timeout=5)
+            return super().encode_queries(queries)
+
+    embedder = BlockingEmbedder()
+    batcher = QueryBatcher(embedder)
+    batcher.start()
+    try:
+        first = asyncio.ensure_future(batcher.embed("first"))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        # The first batch is still in the model; these queue behind it.
+        rest = [
+            asyncio.ensure_future(batcher.embed(f"query {i}"))
+            for i in range(5)]
+        await asyncio.sleep(0.01)
+        assert not first.done()
+        release.set()
+        await asyncio.gather(first, *rest)
+    finally:
+        release.set()
+        await batcher.stop()
+
+    assert embedder.calls == [["first"], [f"query {i}" for i in range(5)]]
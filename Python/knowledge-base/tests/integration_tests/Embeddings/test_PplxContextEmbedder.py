@@ -14,6 +14,8 @@ from knowledge_base.Embeddings.PplxContextEmbedder import (
     DEFAULT_MODEL_PATH,
 )
 from pathlib import Path
+import hashlib
+import importlib.util
 import numpy as np
 import pytest
 
@@ -24,6 +26,40 @@ skip_if_no_model = pytest.mark.skipif(
     not model_available,
     reason=f"Model not found at {DEFAULT_MODEL_PATH}"
 )
+# encode() and encode_queries() run under torch.inference_mode, so the
+# stub-model tests still need torch, though not the model.
+skip_if_no_torch = pytest.mark.skipif(
+    importlib.util.find_spec("torch") is None,
+    reason="torch is not installed"
+)
+
+
+class StubModel:
+    """Stands in for the loaded model: each chunk's embedding depends only
+    on its text, and every encode() call is recorded."""
+
+    def __init__(self):
+        self.calls = []
+
+    @staticmethod
+    def embed(text):
+        seed = int.from_bytes(
+            hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(),
+            "little")
+        return np.random.default_rng(seed).standard_normal(
+            PplxContextEmbedder.EMBEDDING_DIM).astype(np.float32)
+
+    def encode(self, doc_chunks):
+        self.calls.append(doc_chunks)
+        return [
+            np.stack([self.embed(chunk) for chunk in chunks])
+            for chunks in doc_chunks]
+
+
+def stub_embedder(**kwargs):
+    embedder = PplxContextEmbedder(**kwargs)
+    embedder._model = StubModel()
+    return embedder
 
 
 def test_PplxContextEmbedder_instantiates():
@@ -86,3 +122,61 @@ def test_PplxContextEmbedder_embeddings_are_finite():
 
     assert result is not None
     assert np.all(np.isfinite(result)), "All embedding values should be finite"
+
+
+@skip_if_no_torch
+def test_PplxContextEmbedder_cache_hit_skips_model():
+    embedder = stub_embedder()
+    first = embedder.encode([["Chunk one.", "Chunk two."]])[0]
+    second = embedder.encode([["Chunk one.", "Chunk two."]])[0]
+
+    assert len(embedder._model.calls) == 1
+    assert second is first
+    np.testing.assert_allclose(
+        np.linalg.norm(first, axis=1), 1.0, rtol=1e-5)
+
+
+@skip_if_no_torch
+def test_PplxContextEmbedder_cache_evicts_least_recently_used():
+    embedder = stub_embedder(cache_size=2)
+    embedder.encode([["A"], ["B"]])
+    embedder.encode([["A"]])
+    embedder.encode([["C"]])
+    assert len(embedder._cache) == 2
+    assert len(embedder._model.calls) == 3
+
+    # B was least recently used, so it is encoded again; A is not.
+    embedder.encode([["A"]])
+    assert len(embedder._model.calls) == 3
+    embedder.encode([["B"]])
+    assert len(embedder._model.calls) == 4
+
+
+@skip_if_no_torch
+def test_PplxContextEmbedder_cached_embeddings_are_read_only():
+    embedder = stub_embedder()
+    embeddings = embedder.encode([["Chunk one."]])[0]
+    with pytest.raises(ValueError):
+        embeddings[0, 0] = 0.0
+
+    embedder.encode_queries(["A query."])
+    cached = embedder.encode([["A query."]])[0]
+    with pytest.raises(ValueError):
+        cached[0, 0] = 0.0
+
+
+@skip_if_no_torch
+def test_PplxContextEmbedder_encode_queries_matches_per_query_encode():
+    queries = ["First query.", "Second query.", "First query.", "Third."]
+    embedder = stub_embedder(chunk_batch_size=2)
+    # Warm the cache with one query so both cached and encoded rows are
+    # checked.
+    embedder.encode([["Second query."]])
+
+    batched = embedder.encode_queries(queries)
+
+    assert batched.shape == (len(queries), PplxContextEmbedder.EMBEDDING_DIM)
+    reference = stub_embedder(cache_size=0)
+    for query, row in zip(queries, batched):
+        np.testing.assert_allclose(
+            row, reference.encode([[query]])[0][0], rtol=1e-6, atol=1e-6)